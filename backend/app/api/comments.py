@@ -1,45 +1,138 @@
 # api/comments.py
-from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session, aliased
+from typing import Optional, Tuple
+from datetime import datetime
 import logging
 
 from ..database import get_db
-from ..models import Comment, Post
+from ..models import Comment, Post, User
+from ..utils.user_counts import adjust_user_counts
 from ..schemas import CommentCreate
 from ..core.deps import get_current_user
+from ..core.events import broker, post_topic
+from ..core.ranking import ranking
+from ..core.user_directory import user_directory
+from ..utils.comment_tree import child_path, subtree_upper_bound
+from ..utils.archive import load_archived_post, page_archived_comments
+from ..utils.hot_queries import fetch_comments_with_post, fetch_comment_rows
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/comments", tags=["comments"])
 
+def _serialize_comment(comment: Comment, author_username: str) -> dict:
+    return {
+        "id": comment.id,
+        "content": comment.content,
+        "created_at": comment.created_at,
+        "updated_at": comment.updated_at,
+        "author_id": comment.author_id,
+        "author_username": author_username,
+        "parent_id": comment.parent_id,
+        "depth": comment.depth or 0,
+        "reply_count": comment.reply_count or 0,
+        "path": comment.path  # 스레드 내 정렬 위치 (클라이언트가 답글 삽입 위치 계산)
+    }
+
+def _serialize_comments(db: Session, comments: list) -> list:
+    """댓글 목록 직렬화 (작성자 이름은 사용자 디렉터리에서 한 번에 조회)"""
+    usernames = user_directory.usernames(db, [comment.author_id for comment in comments])
+    return [_serialize_comment(comment, usernames.get(comment.author_id)) for comment in comments]
+
+def fetch_comment_page(db: Session, post_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> Tuple[list, Optional[str]]:
+    """스레드 순서로 댓글 조회, (댓글 목록, 다음 페이지 시작 기준 path) 반환"""
+    # (post_id, path) 인덱스 순서 그대로 조회
+    if limit is None:
+        return _serialize_comments(db, fetch_comment_rows(db, post_id, after=after)), None
+    
+    rows = fetch_comment_rows(db, post_id, limit + 1, after)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_after = rows[-1].path if has_more else None
+    return _serialize_comments(db, rows), next_after
+
 @router.get("/post/{post_id}")
-async def get_comments(post_id: int, db: Session = Depends(get_db)):
-    """게시글의 댓글 목록 조회"""
+async def get_comments(
+    post_id: int,
+    after: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """게시글의 댓글 목록 조회 (스레드 순서로 펼친 목록, after 이후 limit개)"""
     try:
-        # 게시글 존재 확인
-        post = db.query(Post).filter(Post.id == post_id).first()
-        if not post:
-            raise HTTPException(status_code=404, detail="Post not found")
+        # 게시글 존재 확인과 댓글 조회를 한 번에
+        rows = fetch_comments_with_post(db, post_id, limit, after)
+        if rows is None:
+            # 보관된 게시글이면 보관 데이터에서 조회
+            archived = load_archived_post(db, post_id)
+            if not archived:
+                raise HTTPException(status_code=404, detail="Post not found")
+            comments, _ = page_archived_comments(archived["comments"], limit, after)
+            return comments
         
-        comments = db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.created_at.asc()).all()
+        return _serialize_comments(db, rows)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get comments error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch comments")
+
+@router.get("/post/{post_id}/top")
+async def get_top_comments(
+    post_id: int,
+    roots: int = Query(20, ge=1, le=100),
+    replies: int = Query(3, ge=0, le=50),
+    db: Session = Depends(get_db)
+):
+    """루트 댓글 상위 N개와 각 스레드의 첫 답글 K개 조회"""
+    try:
+        root_paths = db.query(Comment.path.label("root_path")).filter(
+            Comment.post_id == post_id, Comment.depth == 0
+        ).order_by(Comment.path).limit(roots).subquery()
         
-        comment_list = []
-        for comment in comments:
-            comment_list.append({
-                "id": comment.id,
-                "content": comment.content,
-                "created_at": comment.created_at,
-                "updated_at": comment.updated_at,
-                "author_id": comment.author_id,
-                "author_username": comment.author.username
-            })
+        # 루트별 서브트리 범위에서 path 순으로 번호를 매겨 앞부분만 선택
+        ranked = db.query(
+            Comment.id.label("id"),
+            func.row_number().over(partition_by=root_paths.c.root_path, order_by=Comment.path).label("rn")
+        ).join(root_paths, and_(
+            Comment.path >= root_paths.c.root_path,
+            Comment.path < subtree_upper_bound(root_paths.c.root_path)
+        )).filter(Comment.post_id == post_id).subquery()
         
-        return comment_list
+        rows = db.query(Comment).join(ranked, ranked.c.id == Comment.id).filter(
+            ranked.c.rn <= replies + 1
+        ).order_by(Comment.path).all()
         
+        return _serialize_comments(db, rows)
+    
+    except Exception as e:
+        logger.error(f"Get top comments error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch comments")
+
+@router.get("/{comment_id}/thread")
+async def get_comment_thread(comment_id: int, db: Session = Depends(get_db)):
+    """댓글과 모든 하위 답글 조회"""
+    try:
+        root = aliased(Comment)
+        rows = db.query(Comment).join(root, and_(
+            root.id == comment_id,
+            Comment.post_id == root.post_id,
+            Comment.path >= root.path,
+            Comment.path < subtree_upper_bound(root.path)
+        )).order_by(Comment.path).all()
+        
+        if not rows:
+            raise HTTPException(status_code=404, detail="Comment not found")
+        
+        return _serialize_comments(db, rows)
+    
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Get comments error: {e}")
+        logger.error(f"Get comment thread error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch comments")
 
 @router.post("")
@@ -48,10 +141,10 @@ async def create_comment(
     current_user: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """댓글 작성"""
+    """댓글 작성 (parent_id가 있으면 답글)"""
     try:
         # 게시글 존재 확인
-        post = db.query(Post).filter(Post.id == comment_data.post_id).first()
+        post = db.query(Post.id).filter(Post.id == comment_data.post_id).first()
         if not post:
             raise HTTPException(status_code=404, detail="Post not found")
         
@@ -59,18 +152,46 @@ async def create_comment(
         if len(comment_data.content) > settings.MAX_COMMENT_LENGTH:
             raise HTTPException(status_code=400, detail="Comment too long")
         
+        parent = None
+        if comment_data.parent_id is not None:
+            parent = db.query(Comment).filter(Comment.id == comment_data.parent_id).first()
+            if not parent or parent.post_id != comment_data.post_id:
+                raise HTTPException(status_code=404, detail="Parent comment not found")
+            if parent.depth >= settings.MAX_COMMENT_DEPTH:
+                raise HTTPException(status_code=400, detail="Reply depth exceeded")
+        
+        now = datetime.now()
         comment = Comment(
             content=comment_data.content,
             post_id=comment_data.post_id,
-            author_id=current_user
+            author_id=current_user,
+            parent_id=parent.id if parent else None,
+            depth=parent.depth + 1 if parent else 0,
+            reply_count=0,
+            created_at=now,
+            updated_at=now
         )
         db.add(comment)
+        db.flush()  # path에 들어갈 ID 확보
+        comment.path = child_path(parent.path if parent else "", comment.id)
+        comment.updated_at = Comment.updated_at  # path 기록은 수정이 아니므로 수정 시각 유지
+        
+        if parent:
+            db.query(Comment).filter(Comment.id == parent.id).update(
+                {Comment.reply_count: Comment.reply_count + 1, Comment.updated_at: Comment.updated_at},
+                synchronize_session=False
+            )
+        
+        adjust_user_counts(db, User.comment_count, {current_user: 1})
         db.commit()
         db.refresh(comment)
         
+        broker.publish(post_topic(comment.post_id), "comment_created", _serialize_comment(comment, user_directory.username(db, comment.author_id)))
+        ranking.record_comment(comment.post_id)
+        
         logger.info(f"Comment created: {comment.id} by {current_user}")
         return {"message": "Comment created successfully", "comment_id": comment.id}
-        
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -84,7 +205,7 @@ async def delete_comment(
     current_user: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """댓글 삭제"""
+    """댓글 삭제 (하위 답글 포함)"""
     try:
         comment = db.query(Comment).filter(Comment.id == comment_id).first()
         if not comment:
@@ -93,12 +214,34 @@ async def delete_comment(
         if comment.author_id != current_user:
             raise HTTPException(status_code=403, detail="Not authorized")
         
-        db.delete(comment)
+        post_id = comment.post_id
+        subtree = (
+            Comment.post_id == post_id,
+            Comment.path >= comment.path,
+            Comment.path < subtree_upper_bound(comment.path)
+        )
+        deleted = db.query(Comment.id, Comment.author_id).filter(*subtree).all()
+        deleted_ids = [row.id for row in deleted]
+        
+        # 함께 삭제되는 답글 작성자들의 댓글 수 차감
+        deltas = {}
+        for row in deleted:
+            deltas[row.author_id] = deltas.get(row.author_id, 0) - 1
+        adjust_user_counts(db, User.comment_count, deltas)
+        
+        if comment.parent_id is not None:
+            db.query(Comment).filter(Comment.id == comment.parent_id).update(
+                {Comment.reply_count: Comment.reply_count - 1, Comment.updated_at: Comment.updated_at},
+                synchronize_session=False
+            )
+        db.query(Comment).filter(*subtree).delete(synchronize_session=False)
         db.commit()
         
+        broker.publish(post_topic(post_id), "comment_deleted", {"id": comment_id, "ids": deleted_ids})
+        
         logger.info(f"Comment deleted: {comment_id} by {current_user}")
         return {"message": "Comment deleted successfully"}
-        
+    
     except HTTPException:
         raise
     except Exception as e:
@@ -0,0 +1,46 @@
+# api/events.py
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+import asyncio
+import logging
+
+from ..core.events import broker, board_topic, post_topic
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/events", tags=["events"])
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # 프록시 버퍼링 비활성화
+}
+
+async def _event_stream(request: Request, topic: str):
+    """토픽 구독 후 SSE 메시지 전송 (유휴 시 keepalive, 재접속 시 놓친 이벤트부터)"""
+    queue = broker.subscribe(topic, request.headers.get("last-event-id"))
+    try:
+        yield "retry: 3000\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout=settings.EVENTS_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keepalive\n\n"
+                continue
+
+            if message is None:  # 브로커가 구독을 종료함
+                break
+            yield message
+    finally:
+        broker.unsubscribe(topic, queue)
+
+@router.get("/board")
+async def board_events(request: Request):
+    """게시판 전체 이벤트 구독 (게시글 작성/수정/삭제)"""
+    return StreamingResponse(_event_stream(request, board_topic()), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@router.get("/posts/{post_id}")
+async def post_events(post_id: int, request: Request):
+    """게시글 이벤트 구독 (댓글 작성/삭제, 게시글 수정/삭제)"""
+    return StreamingResponse(_event_stream(request, post_topic(post_id)), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -1,14 +1,28 @@
 # api/posts.py
 from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.orm.exc import StaleDataError
+from typing import Optional
 from datetime import datetime
 import logging
 
 from ..database import get_db
-from ..models import Post
-from ..schemas import PostCreate, PostUpdate
-from ..core.deps import get_current_user
+from ..models import Post, User, Comment, PostRevision
+from ..schemas import PostCreate, PostUpdate, PostPatch
+from ..core.deps import get_current_user, get_optional_user
+from ..core.events import broker, board_topic, post_topic
+from ..core.ranking import ranking
+from ..core.suggest import suggest_index
+from ..core.user_directory import user_directory
+from ..utils.upload_refs import sync_post_uploads
+from ..utils.html_utils import make_excerpt
+from ..utils.user_counts import adjust_user_counts
+from ..utils.revisions import apply_ops, ensure_base_revision, record_revision, load_revision
+from ..utils.hot_queries import fetch_post_page, view_post
 from ..config import settings
+from ..utils.archive import load_archived_post, page_archived_comments, delete_archived_post
+from .comments import fetch_comment_page
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/posts", tags=["posts"])
@@ -21,7 +35,9 @@ async def get_posts(page: int = 1, limit: int = 10, db: Session = Depends(get_db
             limit = 100
         
         offset = (page - 1) * limit
-        posts = db.query(Post).order_by(Post.created_at.desc()).offset(offset).limit(limit).all()
+        # 페이지, 댓글 수, 전체 수를 한 문장으로 조회 (본문 제외)
+        posts, total = fetch_post_page(db, offset, limit)
+        usernames = user_directory.usernames(db, [post.author_id for post in posts])
         
         post_list = []
         for post in posts:
@@ -32,12 +48,10 @@ async def get_posts(page: int = 1, limit: int = 10, db: Session = Depends(get_db
                 "updated_at": post.updated_at,
                 "views": post.view_count,
                 "author_id": post.author_id,
-                "author_username": post.author.username,
-                "comment_count": len(post.comments)
+                "author_username": usernames.get(post.author_id),
+                "comment_count": post.comment_count
             })
         
-        total = db.query(Post).count()
-        
         return {
             "posts": post_list,
             "total": total,
@@ -50,33 +64,137 @@ async def get_posts(page: int = 1, limit: int = 10, db: Session = Depends(get_db
         logger.error(f"Get posts error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch posts")
 
+@router.get("/popular")
+async def get_popular_posts(limit: int = Query(20, ge=1, le=100), db: Session = Depends(get_db)):
+    """조회수 기준 인기 게시글 (메모리 순위표)"""
+    try:
+        return {"posts": ranking.feed(db, "popular", limit)}
+    except Exception as e:
+        logger.error(f"Get popular posts error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch posts")
+
+@router.get("/trending")
+async def get_trending_posts(limit: int = Query(20, ge=1, le=100), db: Session = Depends(get_db)):
+    """조회·댓글·최신성 감쇠 점수 기준 트렌딩 게시글 (메모리 순위표)"""
+    try:
+        return {"posts": ranking.feed(db, "trending", limit)}
+    except Exception as e:
+        logger.error(f"Get trending posts error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch posts")
+
+@router.get("/suggest")
+async def suggest_posts(
+    prefix: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=20)
+):
+    """제목 자동완성 (메모리 접두사 색인, 자모 단위 / 초성 검색 지원)"""
+    return {"suggestions": suggest_index.suggest(prefix, limit)}
+
+@router.get("/search")
+async def search_posts(q: str = Query(..., min_length=2), db: Session = Depends(get_db)):
+    """게시글 검색"""
+    try:
+        posts = db.query(
+            Post.id, Post.title, Post.excerpt, Post.created_at, Post.author_id
+        ).filter(
+            (Post.title.ilike(f"%{q}%")) | (Post.content.ilike(f"%{q}%"))
+        ).order_by(Post.created_at.desc()).limit(100).all()
+        usernames = user_directory.usernames(db, [post.author_id for post in posts])
+        
+        post_list = []
+        for post in posts:
+            post_list.append({
+                "id": post.id,
+                "title": post.title,
+                "content": post.excerpt or "",
+                "created_at": post.created_at,
+                "author_id": post.author_id,
+                "author_username": usernames.get(post.author_id)
+            })
+        
+        return post_list
+        
+    except Exception as e:
+        logger.error(f"Search posts error: {e}")
+        raise HTTPException(status_code=500, detail="Search failed")
+
+def _view_post_detail(db: Session, post_id: int) -> Optional[dict]:
+    """조회수를 원자적으로 증가시키며 게시글 상세 조회 (작성자 이름은 사용자 디렉터리에서)"""
+    post = view_post(db, post_id)
+    if not post:
+        return None
+    
+    return {
+        "id": post.id,
+        "title": post.title,
+        "content": post.content,
+        "created_at": post.created_at,
+        "updated_at": post.updated_at,
+        "view_count": post.view_count,
+        "revision": post.revision,
+        "author_id": post.author_id,
+        "author_username": user_directory.username(db, post.author_id)
+    }
+
 @router.get("/{post_id}")
 async def get_post(post_id: int, db: Session = Depends(get_db)):
     """게시글 상세 조회 (조회수 증가)"""
     try:
-        post = db.query(Post).filter(Post.id == post_id).first()
-        if not post:
-            raise HTTPException(status_code=404, detail="Post not found")
+        result = _view_post_detail(db, post_id)
+        if not result:
+            # 보관된 게시글은 읽기 전용 (조회수 증가 없음)
+            archived = load_archived_post(db, post_id)
+            if not archived:
+                raise HTTPException(status_code=404, detail="Post not found")
+            return archived["post"]
         
-        # 조회수 증가
-        post.view_count += 1
-        db.commit()
+        ranking.record_view(result)
+        return result
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get post error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch post")
+
+@router.get("/{post_id}/bundle")
+async def get_post_bundle(
+    post_id: int,
+    comment_limit: int = Query(50, ge=1, le=500),
+    viewer: Optional[str] = Depends(get_optional_user),
+    db: Session = Depends(get_db)
+):
+    """게시글 상세 화면에 필요한 게시글, 댓글 첫 페이지, 사용자 권한을 한 번에 조회"""
+    try:
+        post = _view_post_detail(db, post_id)
+        if post:
+            comments, next_after = fetch_comment_page(db, post_id, comment_limit)
+            ranking.record_view(post)
+        else:
+            # 보관된 게시글은 읽기 전용
+            archived = load_archived_post(db, post_id)
+            if not archived:
+                raise HTTPException(status_code=404, detail="Post not found")
+            post = archived["post"]
+            comments, next_after = page_archived_comments(archived["comments"], comment_limit)
         
+        read_only = post.get("archived", False)
+        is_author = viewer is not None and viewer == post["author_id"]
         return {
-            "id": post.id,
-            "title": post.title,
-            "content": post.content,
-            "created_at": post.created_at,
-            "updated_at": post.updated_at,
-            "view_count": post.view_count,
-            "author_id": post.author_id,
-            "author_username": post.author.username
+            "post": post,
+            "comments": {"items": comments, "next_after": next_after},
+            "viewer": {
+                "user_id": viewer,
+                "can_edit": is_author and not read_only,
+                "can_delete": is_author,  # 보관된 게시글도 작성자는 삭제 가능
+                "can_comment": not read_only and viewer is not None
+            }
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Get post error: {e}")
+        logger.error(f"Get post bundle error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch post")
 
 @router.post("")
@@ -97,12 +215,26 @@ async def create_post(
         post = Post(
             title=post_data.title,
             content=post_data.content,
+            excerpt=make_excerpt(post_data.content),
             author_id=current_user
         )
+        sync_post_uploads(post)
         db.add(post)
+        adjust_user_counts(db, User.post_count, {current_user: 1})
         db.commit()
         db.refresh(post)
         
+        created = {
+            "id": post.id,
+            "title": post.title,
+            "created_at": post.created_at,
+            "author_id": post.author_id,
+            "author_username": user_directory.username(db, current_user)
+        }
+        broker.publish(board_topic(), "post_created", created)
+        ranking.record_post(created)
+        suggest_index.add(created["id"], created["title"])
+        
         logger.info(f"Post created: {post.id} by {current_user}")
         return {"message": "Post created successfully", "post_id": post.id}
         
@@ -113,6 +245,42 @@ async def create_post(
         logger.error(f"Create post error: {e}")
         raise HTTPException(status_code=500, detail="Failed to create post")
 
+def _save_post_changes(db: Session, post: Post, title: Optional[str], content: Optional[str], ops: Optional[list] = None) -> int:
+    """게시글 변경 적용 및 리비전 기록 후 커밋, 새 리비전 번호 반환"""
+    previous_content = post.content
+    # 첫 수정이면 수정 전 내용을 기준 스냅샷으로 보관 (작성 시에는 이력을 저장하지 않음)
+    ensure_base_revision(db, post.id, post.revision, post.title, previous_content)
+    
+    if title is not None:
+        if len(title) > settings.MAX_TITLE_LENGTH:
+            raise HTTPException(status_code=400, detail="Title too long")
+        post.title = title
+    
+    if content is not None:
+        if len(content) > settings.MAX_CONTENT_LENGTH:
+            raise HTTPException(status_code=400, detail="Content too long")
+        post.content = content
+        post.excerpt = make_excerpt(content)
+        sync_post_uploads(post)
+    
+    post.updated_at = datetime.now()
+    try:
+        # UPDATE ... WHERE revision = 이전 리비전 (동시 수정 시 충돌)
+        db.flush()
+    except StaleDataError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Post was modified by another request")
+    
+    record_revision(db, post.id, post.revision, post.title, post.content, previous_content, ops)
+    event = {"id": post.id, "title": post.title, "updated_at": post.updated_at, "revision": post.revision}
+    db.commit()
+    
+    broker.publish(board_topic(), "post_updated", event)
+    broker.publish(post_topic(event["id"]), "post_updated", event)
+    ranking.update_title(event["id"], event["title"])
+    suggest_index.add(event["id"], event["title"])
+    return event["revision"]
+
 @router.put("/{post_id}")
 async def update_post(
     post_id: int,
@@ -120,31 +288,19 @@ async def update_post(
     current_user: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """게시글 수정"""
+    """게시글 수정 (전체 교체)"""
     try:
-        post = db.query(Post).filter(Post.id == post_id).first()
+        post = db.query(Post).options(undefer(Post.content)).filter(Post.id == post_id).first()
         if not post:
             raise HTTPException(status_code=404, detail="Post not found")
         
         if post.author_id != current_user:
             raise HTTPException(status_code=403, detail="Not authorized")
         
-        # 업데이트
-        if post_data.title is not None:
-            if len(post_data.title) > settings.MAX_TITLE_LENGTH:
-                raise HTTPException(status_code=400, detail="Title too long")
-            post.title = post_data.title
-        
-        if post_data.content is not None:
-            if len(post_data.content) > settings.MAX_CONTENT_LENGTH:
-                raise HTTPException(status_code=400, detail="Content too long")
-            post.content = post_data.content
-        
-        post.updated_at = datetime.now()
-        db.commit()
+        revision = _save_post_changes(db, post, post_data.title, post_data.content)
         
         logger.info(f"Post updated: {post_id} by {current_user}")
-        return {"message": "Post updated successfully"}
+        return {"message": "Post updated successfully", "revision": revision}
         
     except HTTPException:
         raise
@@ -153,24 +309,124 @@ async def update_post(
         logger.error(f"Update post error: {e}")
         raise HTTPException(status_code=500, detail="Failed to update post")
 
+@router.patch("/{post_id}")
+async def patch_post(
+    post_id: int,
+    patch: PostPatch,
+    current_user: str = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """게시글 부분 수정 (기준 리비전 대비 변경 연산만 전송)"""
+    try:
+        post = db.query(Post).options(undefer(Post.content)).filter(Post.id == post_id).first()
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+        
+        if post.author_id != current_user:
+            raise HTTPException(status_code=403, detail="Not authorized")
+        
+        if patch.base_revision != post.revision:
+            raise HTTPException(status_code=409, detail=f"Base revision is stale (current: {post.revision})")
+        
+        ops = [list(op) for op in patch.ops]
+        content = apply_ops(post.content, ops) if ops else None
+        revision = _save_post_changes(db, post, patch.title, content, ops)
+        
+        logger.info(f"Post patched: {post_id} -> r{revision} by {current_user}")
+        return {"message": "Post updated successfully", "revision": revision}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Patch post error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update post")
+
+@router.get("/{post_id}/revisions")
+async def get_post_revisions(post_id: int, db: Session = Depends(get_db)):
+    """게시글 리비전 목록"""
+    try:
+        rows = db.query(
+            PostRevision.revision, PostRevision.title, PostRevision.is_snapshot,
+            PostRevision.created_at, func.length(PostRevision.data).label("size")
+        ).filter(PostRevision.post_id == post_id).order_by(PostRevision.revision.desc()).all()
+        
+        return [{
+            "revision": row.revision,
+            "title": row.title,
+            "is_snapshot": row.is_snapshot,
+            "created_at": row.created_at,
+            "size": row.size
+        } for row in rows]
+        
+    except Exception as e:
+        logger.error(f"Get post revisions error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch revisions")
+
+@router.get("/{post_id}/revisions/{revision}")
+async def get_post_revision(post_id: int, revision: int, db: Session = Depends(get_db)):
+    """특정 리비전의 제목과 본문 복원"""
+    try:
+        restored = load_revision(db, post_id, revision)
+        if restored is None:
+            # 수정된 적 없는 글은 이력이 없으므로 현재 리비전만 본문에서 조회
+            post = db.query(Post).options(undefer(Post.content)).filter(Post.id == post_id, Post.revision == revision).first()
+            if not post:
+                raise HTTPException(status_code=404, detail="Revision not found")
+            restored = post.title, post.content
+        
+        title, content = restored
+        return {"post_id": post_id, "revision": revision, "title": title, "content": content}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get post revision error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch revision")
+
 @router.delete("/{post_id}")
 async def delete_post(
     post_id: int,
     current_user: str = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """게시글 삭제"""
+    """게시글 삭제 (보관된 게시글 포함)"""
     try:
         post = db.query(Post).filter(Post.id == post_id).first()
         if not post:
-            raise HTTPException(status_code=404, detail="Post not found")
+            deleted = delete_archived_post(db, post_id, current_user)
+            if deleted is None:
+                raise HTTPException(status_code=404, detail="Post not found")
+            if not deleted:
+                raise HTTPException(status_code=403, detail="Not authorized")
+            db.commit()
+            
+            broker.publish(board_topic(), "post_deleted", {"id": post_id})
+            broker.publish(post_topic(post_id), "post_deleted", {"id": post_id})
+            logger.info(f"Archived post deleted: {post_id} by {current_user}")
+            return {"message": "Post deleted successfully"}
         
         if post.author_id != current_user:
             raise HTTPException(status_code=403, detail="Not authorized")
         
+        # 게시글과 함께 삭제되는 댓글 수를 작성자별로 차감
+        comment_counts = dict(
+            db.query(Comment.author_id, func.count(Comment.id))
+            .filter(Comment.post_id == post_id)
+            .group_by(Comment.author_id)
+            .all()
+        )
+        adjust_user_counts(db, User.comment_count, {author: -count for author, count in comment_counts.items()})
+        adjust_user_counts(db, User.post_count, {post.author_id: -1})
+        
         db.delete(post)
         db.commit()
         
+        broker.publish(board_topic(), "post_deleted", {"id": post_id})
+        broker.publish(post_topic(post_id), "post_deleted", {"id": post_id})
+        ranking.forget(post_id)
+        suggest_index.remove(post_id)
+        
         logger.info(f"Post deleted: {post_id} by {current_user}")
         return {"message": "Post deleted successfully"}
         
@@ -180,28 +436,3 @@ async def delete_post(
         db.rollback()
         logger.error(f"Delete post error: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete post")
-
-@router.get("/search")
-async def search_posts(q: str = Query(..., min_length=2), db: Session = Depends(get_db)):
-    """게시글 검색"""
-    try:
-        posts = db.query(Post).filter(
-            (Post.title.ilike(f"%{q}%")) | (Post.content.ilike(f"%{q}%"))
-        ).order_by(Post.created_at.desc()).limit(100).all()
-        
-        post_list = []
-        for post in posts:
-            post_list.append({
-                "id": post.id,
-                "title": post.title,
-                "content": post.content[:200] + "..." if len(post.content) > 200 else post.content,
-                "created_at": post.created_at,
-                "author_id": post.author_id,
-                "author_username": post.author.username
-            })
-        
-        return post_list
-        
-    except Exception as e:
-        logger.error(f"Search posts error: {e}")
-        raise HTTPException(status_code=500, detail="Search failed")
@@ -1,11 +1,15 @@
 # api/upload.py
-from fastapi import APIRouter, HTTPException, Depends, File, UploadFile
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, File, UploadFile, Header, Request, Response
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
 import logging
 
-from ..schemas import UploadResponse
+from ..schemas import UploadResponse, ResumableUploadCreate
 from ..core.deps import get_current_user
 from ..utils.file_utils import save_upload_file, validate_file_size
+from ..utils import resumable_upload
+from ..utils.upload_gc import sweeper
 from ..config import settings
 
 logger = logging.getLogger(__name__)
@@ -66,3 +70,94 @@ async def upload_multiple_files(
     except Exception as e:
         logger.error(f"Multiple file upload error: {e}")
         raise HTTPException(status_code=500, detail="Multiple file upload failed")
+
+@router.get("/gc/stats")
+async def get_upload_gc_stats(current_user: str = Depends(get_current_user)):
+    """고아 업로드 정리 통계 (누적 삭제 수, 회수 용량)"""
+    return sweeper.stats
+
+def _session_status(session: dict) -> dict:
+    return {
+        "upload_id": session["upload_id"],
+        "filename": session["filename"],
+        "size": session["size"],
+        "offset": session["offset"],
+        "chunk_size": settings.RESUMABLE_CHUNK_SIZE,
+        "completed": "result" in session,
+        "file": session.get("result")
+    }
+
+async def _read_chunk(request: Request) -> bytes:
+    """요청 본문을 최대 청크 크기까지만 읽음"""
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > settings.RESUMABLE_MAX_CHUNK_SIZE:
+        raise HTTPException(status_code=413, detail="Chunk too large")
+    
+    data = bytearray()
+    async for part in request.stream():
+        data.extend(part)
+        if len(data) > settings.RESUMABLE_MAX_CHUNK_SIZE:
+            raise HTTPException(status_code=413, detail="Chunk too large")
+    return bytes(data)
+
+@router.post("/sessions", status_code=201)
+async def create_upload_session(
+    upload: ResumableUploadCreate,
+    response: Response,
+    current_user: str = Depends(get_current_user)
+):
+    """이어받기 업로드 세션 생성 (전체 크기 선언)"""
+    try:
+        session = resumable_upload.create_session(current_user, upload.filename, upload.size, upload.mime_type)
+        response.headers["Location"] = f"/api/upload/sessions/{session['upload_id']}"
+        logger.info(f"Upload session created: {session['upload_id']} ({upload.size} bytes) by {current_user}")
+        return _session_status(session)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Create upload session error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create upload session")
+
+@router.head("/sessions/{upload_id}")
+async def head_upload_session(upload_id: str, current_user: str = Depends(get_current_user)):
+    """재개할 오프셋 조회 (tus 방식 Upload-Offset 헤더)"""
+    session = resumable_upload.load_session(upload_id, current_user)
+    return Response(headers={
+        "Upload-Offset": str(session["offset"]),
+        "Upload-Length": str(session["size"]),
+        "Cache-Control": "no-store"
+    })
+
+@router.get("/sessions/{upload_id}")
+async def get_upload_session(upload_id: str, current_user: str = Depends(get_current_user)):
+    """업로드 세션 상태 조회"""
+    return _session_status(resumable_upload.load_session(upload_id, current_user))
+
+@router.patch("/sessions/{upload_id}")
+async def upload_chunk(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(...),
+    upload_checksum: Optional[str] = Header(None),
+    current_user: str = Depends(get_current_user)
+):
+    """청크 업로드 (Upload-Offset 위치에 본문 기록, 마지막 청크면 파일 완성)"""
+    try:
+        data = await _read_chunk(request)
+        resumable_upload.verify_checksum(data, upload_checksum)
+        session = await run_in_threadpool(resumable_upload.write_chunk, upload_id, current_user, upload_offset, data)
+        
+        return JSONResponse(content=_session_status(session), headers={"Upload-Offset": str(session["offset"])})
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Upload chunk error: {e}")
+        raise HTTPException(status_code=500, detail="Chunk upload failed")
+
+@router.delete("/sessions/{upload_id}")
+async def delete_upload_session(upload_id: str, current_user: str = Depends(get_current_user)):
+    """업로드 취소 (받은 데이터 삭제)"""
+    resumable_upload.delete_session(upload_id, current_user)
+    return {"message": "Upload cancelled"}
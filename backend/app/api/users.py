@@ -0,0 +1,151 @@
+# api/users.py
+from fastapi import APIRouter, HTTPException, Depends, Query
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+from typing import Optional
+import logging
+
+from ..database import get_db
+from ..models import User, Post, Comment
+from ..schemas import UserUpdate
+from ..core.deps import get_current_user
+from ..core.user_directory import user_directory
+from ..config import settings
+from ..utils.pagination import encode_cursor, decode_cursor
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/users", tags=["users"])
+
+def _page(rows: list, limit: int, serialize) -> dict:
+    """limit + 1개 조회 결과로 페이지와 다음 커서 구성"""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "items": [serialize(row) for row in rows],
+        "next_cursor": encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
+    }
+
+@router.get("/{user_id}")
+async def get_user_profile(user_id: str, db: Session = Depends(get_db)):
+    """사용자 프로필 (활동 수는 users 행에 저장된 값)"""
+    try:
+        user = db.query(
+            User.id, User.username, User.created_at, User.post_count, User.comment_count
+        ).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        
+        return {
+            "id": user.id,
+            "username": user.username,
+            "created_at": user.created_at,
+            "post_count": user.post_count or 0,
+            "comment_count": user.comment_count or 0
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get user profile error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch user")
+
+@router.patch("/me")
+async def update_my_profile(
+    profile: UserUpdate,
+    current_user: str = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """내 프로필(이름) 수정"""
+    try:
+        if len(profile.username) < settings.MIN_USERNAME_LENGTH or len(profile.username) > settings.MAX_USERNAME_LENGTH:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Username must be {settings.MIN_USERNAME_LENGTH}-{settings.MAX_USERNAME_LENGTH} characters"
+            )
+        
+        updated = db.query(User).filter(User.id == current_user).update(
+            {User.username: profile.username}, synchronize_session=False
+        )
+        if not updated:
+            raise HTTPException(status_code=404, detail="User not found")
+        db.commit()
+        
+        # 캐시된 작성자 이름 무효화
+        user_directory.invalidate(current_user)
+        
+        logger.info(f"Profile updated: {current_user}")
+        return {"message": "Profile updated successfully"}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Update profile error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to update profile")
+
+@router.get("/{user_id}/posts")
+async def get_user_posts(
+    user_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """사용자가 작성한 게시글 (최신순, 키셋 페이지네이션)"""
+    try:
+        after = decode_cursor(cursor)
+        
+        # (author_id, created_at, id) 인덱스 범위 조회, 본문 제외
+        query = db.query(
+            Post.id, Post.title, Post.excerpt, Post.created_at, Post.view_count
+        ).filter(Post.author_id == user_id)
+        if after:
+            query = query.filter(tuple_(Post.created_at, Post.id) < tuple_(*after))
+        rows = query.order_by(Post.created_at.desc(), Post.id.desc()).limit(limit + 1).all()
+        
+        return _page(rows, limit, lambda post: {
+            "id": post.id,
+            "title": post.title,
+            "excerpt": post.excerpt or "",
+            "created_at": post.created_at,
+            "views": post.view_count
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get user posts error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch posts")
+
+@router.get("/{user_id}/comments")
+async def get_user_comments(
+    user_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """사용자가 작성한 댓글 (최신순, 키셋 페이지네이션)"""
+    try:
+        after = decode_cursor(cursor)
+        
+        query = db.query(
+            Comment.id, Comment.content, Comment.created_at, Comment.post_id, Comment.parent_id,
+            Post.title.label("post_title")
+        ).outerjoin(Post, Comment.post_id == Post.id).filter(Comment.author_id == user_id)
+        if after:
+            query = query.filter(tuple_(Comment.created_at, Comment.id) < tuple_(*after))
+        rows = query.order_by(Comment.created_at.desc(), Comment.id.desc()).limit(limit + 1).all()
+        
+        return _page(rows, limit, lambda comment: {
+            "id": comment.id,
+            "content": comment.content,
+            "created_at": comment.created_at,
+            "post_id": comment.post_id,
+            "post_title": comment.post_title,
+            "parent_id": comment.parent_id
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get user comments error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch comments")
@@ -4,13 +4,18 @@ from typing import Optional
 
 class Settings:
     # 데이터베이스 설정
-    DATABASE_URL: str = "postgresql://{user}:{password}@{host}:{port}/{database}?options=-csearch_path%3D{schema}".format(
-        user="not2wing",
-        password="skrdla1",
-        host="localhost", 
-        port="5432",
-        database="mydb",
-        schema="board"
+    DB_SCHEMA: str = "board"  # PostgreSQL 전용
+    DATABASE_URL: str = os.getenv(
+        "DATABASE_URL",  # 단일 노드 배포는 "sqlite:///./board.db"
+        # psycopg 3 드라이버 (서버 측 준비된 문장 캐시 사용, "postgresql://"는 psycopg2로 연결되어 캐시 없음)
+        "postgresql+psycopg://{user}:{password}@{host}:{port}/{database}?options=-csearch_path%3D{schema}".format(
+            user="not2wing",
+            password="skrdla1",
+            host="localhost", 
+            port="5432",
+            database="mydb",
+            schema=DB_SCHEMA
+        )
     )
     
     # 데이터베이스 연결 풀 설정
@@ -19,15 +24,97 @@ class Settings:
     DB_POOL_RECYCLE: int = 3600
     DB_POOL_PRE_PING: bool = True
     DB_ECHO: bool = False  # 운영 환경에서는 False
+    DB_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy 컴파일된 문장 캐시 항목 수
+    DB_PREPARE_THRESHOLD: Optional[int] = 2  # psycopg 3: 같은 문장이 N번 실행되면 서버 측 PREPARE (None이면 사용 안 함)
+    
+    # SQLite 설정 (WAL 모드)
+    SQLITE_BUSY_TIMEOUT: int = 5000  # 쓰기 잠금 대기 (ms)
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL에서는 NORMAL로도 손상 없음
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_CACHE_SIZE: int = -64000  # 음수는 KB 단위 (64MB)
+    SQLITE_STATEMENT_CACHE: int = 256  # 연결별 준비된 문장 캐시 크기
     
     # 파일 업로드 설정
     UPLOAD_DIR: str = "uploads"
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
     MAX_FILES_PER_UPLOAD: int = 10
     
+    # 이어받기 업로드 설정 (tus 방식 청크 업로드)
+    RESUMABLE_MAX_FILE_SIZE: int = 2 * 1024 * 1024 * 1024  # 2GB
+    RESUMABLE_CHUNK_SIZE: int = 5 * 1024 * 1024  # 클라이언트 권장 청크 크기
+    RESUMABLE_MAX_CHUNK_SIZE: int = 16 * 1024 * 1024  # 요청 하나의 최대 청크 크기
+    RESUMABLE_EXPIRY: int = 24 * 3600  # 마지막 청크 이후 방치된 세션 정리 (초)
+    
+    # 고아 업로드 파일 정리 설정
+    UPLOAD_GC_ENABLED: bool = True
+    UPLOAD_GC_INTERVAL: int = 3600  # 검사 주기 (초)
+    UPLOAD_GC_GRACE_PERIOD: int = 24 * 3600  # 작성 중인 글을 위한 유예 기간 (초)
+    UPLOAD_GC_SCAN_LIMIT: int = 5000  # 주기당 검사 파일 수
+    UPLOAD_GC_BATCH_SIZE: int = 200  # 참조 조회 배치 크기
+    UPLOAD_GC_MAX_DELETES_PER_SEC: float = 20.0
+    
+    # 사용자 디렉터리 설정 (작성자 이름 프로세스 내 캐시)
+    USER_DIRECTORY_SIZE: int = 10000  # 최대 캐시 사용자 수
+    USER_DIRECTORY_TTL: int = 600  # 다른 워커의 이름 변경 반영 지연 상한 (초)
+    USER_DIRECTORY_WARM: bool = True  # 시작 시 활동 많은 사용자 미리 적재
+    
     # 세션 설정
     SESSION_FILE: str = "sessions.json"
+
+    # 요청 제어 설정 (토큰 버킷 + 동시성 제한)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_STORE: str = "rate_limits.db"  # 워커 프로세스 간 공유, 빈 문자열이면 프로세스 메모리 사용
+    RATE_LIMIT_STORE_TIMEOUT: int = 20  # 공유 저장소 잠금 대기 (ms), 초과 시 검사 생략
+    RATE_LIMIT_TRUST_PROXY: bool = False  # 프록시 뒤에서는 X-Forwarded-For 사용
+    RATE_LIMITS: dict = {
+        # 라우트 분류: (초당 충전 토큰, 버킷 크기) - 사용자/IP별로 각각 적용
+        "login": (0.2, 5),
+        "search": (1.0, 10),
+        "write": (0.5, 20),
+        "read": (10.0, 100),
+        "stream": (0.5, 10),
+        "upload": (5.0, 50),  # 이어받기 업로드 청크
+    }
+    ADMISSION_MAX_CONCURRENCY: int = DB_POOL_SIZE + DB_MAX_OVERFLOW  # DB 풀 크기에 맞춤
+    ADMISSION_MAX_QUEUE: int = 50
+    ADMISSION_QUEUE_TIMEOUT: float = 2.0  # 대기 지연 예산 (초)
+
+    # 실시간 이벤트(SSE) 설정
+    EVENTS_BACKEND: str = "auto"  # auto: PostgreSQL이면 LISTEN/NOTIFY, 아니면 프로세스 내 전달 / postgres / local
+    EVENTS_QUEUE_SIZE: int = 100  # 구독자별 대기 메시지 수 (초과 시 연결 종료)
+    EVENTS_HEARTBEAT_INTERVAL: float = 15.0
+    EVENTS_RECONNECT_DELAY: float = 3.0
+    EVENTS_REPLAY_SIZE: int = 100  # 토픽별 재전송용으로 보관할 최근 이벤트 수
+    EVENTS_REPLAY_TOPICS: int = 1000  # 기록을 보관할 토픽 수 (오래된 토픽부터 제외)
+
+    # 보관 계층 설정 (오래된 게시글을 댓글과 함께 압축 보관, 상세 조회만 가능)
+    ARCHIVE_ENABLED: bool = True
+    ARCHIVE_AFTER_DAYS: int = 365  # 작성/수정/마지막 댓글 이후 경과 일수
+    ARCHIVE_INTERVAL: int = 24 * 3600  # 실행 주기 (초)
+    ARCHIVE_BATCH_SIZE: int = 200  # 주기당 최대 보관 게시글 수
+    
+    # 제목 자동완성 설정
+    SUGGEST_MAX_WORDS: int = 20  # 제목당 색인할 단어 시작 위치 수
+    SUGGEST_SCAN_LIMIT: int = 500  # 검색어당 확인할 최대 색인 항목 수
+    SUGGEST_REFRESH_INTERVAL: int = 600  # 다른 워커의 변경 반영을 위한 재구성 주기 (초)
     
+    # 응답 압축 설정 (brotli / zstandard 모듈이 설치되어 있으면 우선 사용)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # 이보다 작은 응답은 그대로 전송 (bytes)
+    COMPRESSION_OFFLOAD_SIZE: int = 64 * 1024  # 이보다 큰 조각은 스레드풀에서 압축 (bytes)
+    COMPRESSION_LEVELS: dict = {"zstd": 3, "br": 4, "gzip": 6}
+    COMPRESSION_TYPES: list = ["text/", "application/json", "application/javascript", "application/xml", "image/svg+xml"]
+    COMPRESSION_EXCLUDED_TYPES: list = ["text/event-stream"]  # 이벤트 단위 즉시 전달이 필요한 스트림
+    COMPRESSION_EXCLUDED_PATHS: list = ["/uploads", "/api/events"]  # 이미 압축된 업로드 미디어, SSE
+    
+    # 게시글 순위 설정 (인기/트렌딩)
+    RANKING_SIZE: int = 100  # 메모리에 유지할 상위 K개
+    RANKING_HALF_LIFE: int = 6 * 3600  # 트렌딩 점수 반감기 (초)
+    RANKING_VIEW_WEIGHT: float = 1.0
+    RANKING_COMMENT_WEIGHT: float = 5.0
+    RANKING_POST_WEIGHT: float = 10.0  # 새 글 가중치
+    RANKING_CHECKPOINT_INTERVAL: int = 300  # 체크포인트 주기 (초)
+
     # CORS 설정
     CORS_ORIGINS: list = ["http://localhost:5009", "http://dj.kmis.kr:5009"]
     
@@ -49,5 +136,8 @@ class Settings:
     MAX_TITLE_LENGTH: int = 200
     MAX_CONTENT_LENGTH: int = 50000  # 50KB
     MAX_COMMENT_LENGTH: int = 1000
+    MAX_COMMENT_DEPTH: int = 10  # 답글 최대 깊이
+    EXCERPT_LENGTH: int = 200  # 목록/검색용 본문 요약 길이
+    REVISION_SNAPSHOT_INTERVAL: int = 10  # 리비전 전체 본문 저장 주기
 
 settings = Settings()
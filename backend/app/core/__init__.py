@@ -1,8 +1,11 @@
 # core/__init__.py
 from .security import hash_password, verify_password, create_session, get_user_from_session, delete_session
-from .deps import get_current_user
+from .deps import get_current_user, get_optional_user
+from .admission import AdmissionControlMiddleware
+from .compression import CompressionMiddleware
 
 __all__ = [
     "hash_password", "verify_password", "create_session", 
-    "get_user_from_session", "delete_session", "get_current_user"
+    "get_user_from_session", "delete_session", "get_current_user", "get_optional_user",
+    "AdmissionControlMiddleware", "CompressionMiddleware"
 ]
@@ -0,0 +1,238 @@
+# core/admission.py
+import asyncio
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from ..config import settings
+from .security import get_user_from_session
+
+logger = logging.getLogger(__name__)
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+def _refill(bucket: Optional[tuple], now: float, rate: float, burst: int) -> float:
+    """경과 시간만큼 충전한 현재 토큰 수 (bucket: (토큰, 갱신 시각), 없으면 가득 참)"""
+    if bucket is None:
+        return float(burst)
+    tokens, updated = bucket
+    return min(float(burst), tokens + max(0.0, now - updated) * rate)
+
+def _take(levels: dict, rate: float) -> float:
+    """모든 버킷에 토큰이 있으면 각각 1개씩 소비 (levels를 갱신), 대기 시간 반환
+
+    하나라도 부족하면 어느 버킷도 소비하지 않는다 (거절된 요청이 다른 키의 토큰을 깎지 않음).
+    """
+    wait = max((1.0 - tokens) / rate for tokens in levels.values()) if levels else 0.0
+    if wait > 0:
+        return wait
+    for key in levels:
+        levels[key] -= 1.0
+    return 0.0
+
+class MemoryBucketStore:
+    """프로세스 메모리 토큰 버킷 저장소"""
+
+    MAX_KEYS = 100000
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, keys: list, rate: float, burst: int) -> float:
+        now = time.time()
+        with self._lock:
+            levels = {key: _refill(self._buckets.get(key), now, rate, burst) for key in keys}
+            wait = _take(levels, rate)
+            if len(self._buckets) + len(levels) > self.MAX_KEYS:
+                self._buckets.clear()
+            for key, tokens in levels.items():
+                self._buckets[key] = (tokens, now)
+        return wait
+
+class SQLiteBucketStore:
+    """워커 프로세스 간 공유되는 SQLite 파일 토큰 버킷 저장소"""
+
+    PRUNE_EVERY = 1000
+    PRUNE_AGE = 3600
+
+    def __init__(self, path: str):
+        self._path = path
+        self._local = threading.local()
+        self._calls = 0
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # 잠금 대기는 짧게 (초과하면 예외로 검사를 건너뛰고 요청 통과)
+            conn = sqlite3.connect(self._path, timeout=settings.RATE_LIMIT_STORE_TIMEOUT / 1000, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # 재시작 시 유실되어도 무방한 상태
+            self._local.conn = conn
+        return conn
+
+    def consume(self, keys: list, rate: float, burst: int) -> float:
+        """요청의 모든 키를 한 트랜잭션에서 검사/소비 (동기 I/O - 스레드풀에서 호출)"""
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            levels = {}
+            for key in keys:
+                row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+                levels[key] = _refill(row, now, rate, burst)
+            wait = _take(levels, rate)
+            conn.executemany(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                [(key, tokens, now) for key, tokens in levels.items()]
+            )
+            self._calls += 1
+            if self._calls % self.PRUNE_EVERY == 0:
+                conn.execute("DELETE FROM buckets WHERE updated < ?", (now - self.PRUNE_AGE,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return wait
+
+def create_bucket_store():
+    """설정에 따른 토큰 버킷 저장소 생성"""
+    if settings.RATE_LIMIT_STORE:
+        try:
+            return SQLiteBucketStore(os.path.abspath(settings.RATE_LIMIT_STORE))
+        except sqlite3.Error as e:
+            logger.warning(f"Rate limit store unavailable, using process memory: {e}")
+    return MemoryBucketStore()
+
+def classify_route(method: str, path: str) -> Optional[str]:
+    """요청을 요청 제어 분류로 매핑 (None이면 제어 대상 아님)"""
+    if not path.startswith("/api/"):
+        return None
+    if path.startswith("/api/events/"):
+        return "stream"
+    if path.startswith("/api/upload/sessions/") and method != "POST":
+        return "upload"
+    if path in ("/api/auth/login", "/api/auth/signup"):
+        return "login"
+    if path.startswith("/api/posts/search"):
+        return "search"
+    if method in WRITE_METHODS:
+        return "write"
+    return "read"
+
+class ConcurrencyLimiter:
+    """DB 풀 크기에 맞춘 동시 처리 제한 및 대기열 초과 시 요청 차단"""
+
+    def __init__(self, max_concurrency: int, max_queue: int, timeout: float):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self._semaphore = None
+
+    async def acquire(self) -> bool:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self.waiting >= self.max_queue:
+            return False
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        return True
+
+    def release(self):
+        self.active -= 1
+        self._semaphore.release()
+
+class AdmissionControlMiddleware:
+    """사용자/IP별 토큰 버킷과 전역 동시성 제한을 적용하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+        self.store = create_bucket_store()
+        self.limiter = ConcurrencyLimiter(
+            settings.ADMISSION_MAX_CONCURRENCY,
+            settings.ADMISSION_MAX_QUEUE,
+            settings.ADMISSION_QUEUE_TIMEOUT
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify_route(scope["method"], scope["path"])
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        # 토큰 버킷 검사 (세션 파일, 공유 저장소 I/O가 있으므로 이벤트 루프 밖에서)
+        wait = await run_in_threadpool(self._check_rate_limit, Request(scope), route_class)
+        if wait > 0:
+            await self._reject(scope, receive, send, 429, "Too many requests", wait)
+            return
+
+        # 장시간 유지되는 스트림과 업로드 청크는 DB 연결을 점유하지 않으므로 동시성 제한 제외
+        if route_class in ("stream", "upload"):
+            await self.app(scope, receive, send)
+            return
+
+        # 동시성 제한 (대기열/지연 예산 초과 시 즉시 차단)
+        if not await self.limiter.acquire():
+            await self._reject(scope, receive, send, 503, "Server busy", self.limiter.timeout)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.limiter.release()
+
+    def _client_keys(self, request: Request, route_class: str) -> list:
+        """버킷 키 목록 (IP별, 로그인 사용자별)"""
+        ip = request.client.host if request.client else "unknown"
+        if settings.RATE_LIMIT_TRUST_PROXY:
+            forwarded = request.headers.get("x-forwarded-for")
+            if forwarded:
+                ip = forwarded.split(",")[0].strip()
+        keys = [f"{route_class}:ip:{ip}"]
+
+        session_id = request.cookies.get("session_id")
+        if session_id and route_class != "login":
+            user_id = get_user_from_session(session_id)
+            if user_id:
+                keys.append(f"{route_class}:user:{user_id}")
+        return keys
+
+    def _check_rate_limit(self, request: Request, route_class: str) -> float:
+        rate, burst = settings.RATE_LIMITS[route_class]
+        try:
+            # IP와 사용자 버킷을 함께 검사해 둘 다 여유가 있을 때만 소비
+            return self.store.consume(self._client_keys(request, route_class), rate, burst)
+        except Exception as e:
+            # 저장소 장애나 잠금 대기 초과 시 요청은 통과시킴
+            logger.warning(f"Rate limit check failed: {e}")
+            return 0.0
+
+    async def _reject(self, scope, receive, send, status_code: int, detail: str, retry_after: float):
+        response = JSONResponse(
+            status_code=status_code,
+            content={"detail": detail},
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,192 @@
+# core/compression.py
+import zlib
+from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from ..config import settings
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+class _BrotliCompressor:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+    
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+class _ZstdCompressor:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+def available_encodings() -> list:
+    """설치된 모듈 기준 지원 인코딩 (서버 선호 순)"""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+COMPRESSORS = {"gzip": _GzipCompressor, "br": _BrotliCompressor, "zstd": _ZstdCompressor}
+
+def negotiate_encoding(accept_encoding: str, supported: list) -> Optional[str]:
+    """Accept-Encoding의 q 값이 가장 높은 인코딩 선택 (같으면 서버 선호 순)"""
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+def is_compressible(content_type: str) -> bool:
+    """압축 대상 콘텐츠 타입 여부 (이미지/영상 등 압축된 형식 제외)"""
+    content_type = content_type.split(";")[0].strip().lower()
+    if content_type in settings.COMPRESSION_EXCLUDED_TYPES:
+        return False
+    return any(content_type.startswith(prefix) for prefix in settings.COMPRESSION_TYPES)
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상으로 zstd / brotli / gzip 응답 압축하는 ASGI 미들웨어
+    
+    작은 응답은 그대로 보내고, 여러 조각으로 나뉜 응답은 조각마다 압축해 바로 전송한다.
+    큰 조각은 이벤트 루프를 막지 않도록 스레드풀에서 압축한다 (zlib/brotli/zstd 모두 GIL 해제).
+    """
+    
+    def __init__(self, app):
+        self.app = app
+        self.encodings = available_encodings()
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED or self._excluded(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        responder = _CompressedResponder(send, encoding)
+        await self.app(scope, receive, responder.send)
+    
+    def _excluded(self, path: str) -> bool:
+        return any(path.startswith(prefix) for prefix in settings.COMPRESSION_EXCLUDED_PATHS)
+
+class _CompressedResponder:
+    """응답 시작 메시지를 첫 본문 조각까지 보류했다가 압축 여부 결정"""
+    
+    def __init__(self, send, encoding: str):
+        self._send = send
+        self.encoding = encoding
+        self.start_message = None
+        self.compressor = None
+        self.passthrough = False
+    
+    async def send(self, message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            return
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+        
+        if self.passthrough:
+            await self._send(message)
+            return
+        
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        
+        if self.compressor is None:
+            headers = Headers(raw=self.start_message["headers"])
+            if ("content-encoding" in headers
+                    or not is_compressible(headers.get("content-type", ""))
+                    or (not more_body and len(body) < settings.COMPRESSION_MIN_SIZE)):
+                self.passthrough = True
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+            self.compressor = COMPRESSORS[self.encoding](settings.COMPRESSION_LEVELS[self.encoding])
+            
+            if not more_body:
+                # 단일 본문: 전체 압축 후 Content-Length 설정
+                compressed = await self._compress(body, final=True)
+                self._update_headers(len(compressed))
+                await self._send(self.start_message)
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+            
+            # 스트리밍 본문: 길이를 알 수 없으므로 chunked 전송
+            self._update_headers(None)
+            await self._send(self.start_message)
+        
+        compressed = await self._compress(body, final=not more_body)
+        if compressed or not more_body:
+            await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+    
+    async def _compress(self, body: bytes, final: bool) -> bytes:
+        if len(body) >= settings.COMPRESSION_OFFLOAD_SIZE:
+            compressed = await run_in_threadpool(self.compressor.compress, body)
+        else:
+            compressed = self.compressor.compress(body)
+        if final:
+            compressed += self.compressor.finish()
+        return compressed
+    
+    def _update_headers(self, length: Optional[int]):
+        headers = MutableHeaders(raw=list(self.start_message["headers"]))
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
+        # ETag는 인코딩별로 달라야 하므로 약한 ETag로 표시
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+        self.start_message["headers"] = headers.raw
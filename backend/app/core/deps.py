@@ -15,3 +15,9 @@ def get_current_user(session_id: Optional[str] = Cookie(None)):
         raise HTTPException(status_code=401, detail="Invalid session")
     
     return user_id
+
+def get_optional_user(session_id: Optional[str] = Cookie(None)) -> Optional[str]:
+    """로그인하지 않았으면 None을 반환하는 사용자 의존성"""
+    if not session_id:
+        return None
+    return get_user_from_session(session_id)
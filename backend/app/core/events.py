@@ -0,0 +1,238 @@
+# core/events.py
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Optional
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import text
+from ..config import settings
+from ..database import engine
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "board_events"
+NOTIFY_MAX_PAYLOAD = 7900  # PostgreSQL NOTIFY 페이로드 한도 (8000 bytes)
+
+def board_topic() -> str:
+    return "board"
+
+def post_topic(post_id: int) -> str:
+    return f"post:{post_id}"
+
+def format_sse(event_type: str, data: dict, event_id: Optional[str] = None) -> str:
+    """SSE 메시지 문자열 생성 (id가 있으면 브라우저가 재접속 시 Last-Event-ID로 보냄)"""
+    payload = json.dumps(jsonable_encoder(data), ensure_ascii=False, separators=(",", ":"))
+    prefix = f"id: {event_id}\n" if event_id else ""
+    return f"{prefix}event: {event_type}\ndata: {payload}\n\n"
+
+class EventBroker:
+    """토픽별 구독자 큐로 이벤트를 분배하는 프로세스 내 브로커
+
+    PostgreSQL 사용 시 LISTEN/NOTIFY로 다른 워커 프로세스에도 이벤트를 전달한다.
+    이벤트 ID는 발행 시각 기반이라 워커 간에도 순서 비교가 가능하고, 토픽별 최근 이벤트를
+    보관해 두었다가 재접속한 구독자에게 Last-Event-ID 이후 이벤트를 다시 보낸다.
+    놓친 이벤트를 보낼 수 없으면 resync 이벤트로 목록을 다시 불러오게 한다.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+        self._loop = None
+        self._origin = uuid.uuid4().hex  # 자신이 보낸 NOTIFY 무시용
+        self._listener = None
+        self._stopping = threading.Event()
+        self._history = OrderedDict()  # topic -> [최근 (id, 메시지) deque, 잘려나간 마지막 id]
+        self._evicted_upto = ""  # 기록이 통째로 밀려난 토픽의 마지막 id 중 최댓값
+        self._started_id = ""
+        self._last_ns = 0
+        self._id_lock = threading.Lock()
+
+    @property
+    def use_notify(self) -> bool:
+        backend = settings.EVENTS_BACKEND
+        if backend == "auto":
+            return engine.dialect.name == "postgresql"
+        return backend == "postgres"
+
+    async def start(self):
+        """이벤트 루프 연결 및 (필요 시) NOTIFY 수신 스레드 시작"""
+        self._loop = asyncio.get_running_loop()
+        self._stopping.clear()
+        self._started_id = self._next_id()  # 이전 ID는 이 프로세스가 받지 못한 이벤트가 있을 수 있음
+        if self.use_notify and self._listener is None:
+            self._listener = threading.Thread(target=self._listen, name="event-listener", daemon=True)
+            self._listener.start()
+
+    async def stop(self):
+        self._stopping.set()
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._close_queue(queue)
+        self._subscribers.clear()
+
+    def _next_id(self) -> str:
+        """고정 길이 시각(ns) + 워커 구분자, 문자열 비교로 순서 판단"""
+        with self._id_lock:
+            self._last_ns = max(time.time_ns(), self._last_ns + 1)
+            return f"{self._last_ns:020d}-{self._origin[:8]}"
+
+    def subscribe(self, topic: str, last_event_id: Optional[str] = None) -> asyncio.Queue:
+        """구독 큐 생성, 재접속이면 놓친 이벤트(또는 resync)를 먼저 채움"""
+        queue = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+        if last_event_id:
+            messages = self._replay(topic, last_event_id)
+            if messages is None or len(messages) >= queue.maxsize:
+                messages = [format_sse("resync", {}, self._next_id())]
+        else:
+            # 첫 접속은 현재 위치만 알려 줌 (data 없는 메시지는 이벤트로 전달되지 않음)
+            messages = [f"id: {self._next_id()}\n\n"]
+        for message in messages:
+            queue.put_nowait(message)
+        self._subscribers.setdefault(topic, set()).add(queue)
+        return queue
+
+    def _replay(self, topic: str, last_event_id: str) -> Optional[list]:
+        """last_event_id 이후 이벤트 목록, 빠진 이벤트가 있을 수 있으면 None"""
+        if last_event_id < self._started_id:
+            return None
+        entry = self._history.get(topic)
+        if entry is None:
+            return None if last_event_id < self._evicted_upto else []
+        events, dropped_upto = entry
+        if last_event_id < dropped_upto:
+            return None
+        return [message for event_id, message in events if event_id > last_event_id]
+
+    def _remember(self, topic: str, event_id: str, message: str):
+        entry = self._history.get(topic)
+        if entry is None:
+            entry = self._history[topic] = [deque(), ""]
+            if len(self._history) > settings.EVENTS_REPLAY_TOPICS:
+                _, (events, dropped_upto) = self._history.popitem(last=False)
+                self._evicted_upto = max(self._evicted_upto, events[-1][0] if events else dropped_upto)
+        else:
+            self._history.move_to_end(topic)
+        events = entry[0]
+        if len(events) >= settings.EVENTS_REPLAY_SIZE:
+            entry[1] = events.popleft()[0]
+        events.append((event_id, message))
+
+    def unsubscribe(self, topic: str, queue: asyncio.Queue):
+        queues = self._subscribers.get(topic)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[topic]
+
+    def subscriber_count(self, topic: Optional[str] = None) -> int:
+        if topic is not None:
+            return len(self._subscribers.get(topic, ()))
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def publish(self, topic: str, event_type: str, data: dict):
+        """이벤트 발행 (커밋 이후 호출, 실패해도 요청에는 영향 없음)"""
+        try:
+            event_id = self._next_id()
+            message = format_sse(event_type, data, event_id)
+            self._deliver(topic, event_id, message)
+            if self.use_notify:
+                self._notify(topic, event_id, message)
+        except Exception as e:
+            logger.warning(f"Event publish failed: {topic} {event_type}: {e}")
+
+    def _deliver(self, topic: str, event_id: str, message: str):
+        if self._loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._dispatch(topic, event_id, message)
+        else:
+            self._loop.call_soon_threadsafe(self._dispatch, topic, event_id, message)
+
+    def _dispatch(self, topic: str, event_id: str, message: str):
+        """재전송용으로 기록한 뒤 구독자 큐에 직렬화된 메시지를 그대로 분배"""
+        self._remember(topic, event_id, message)
+        queues = self._subscribers.get(topic)
+        if not queues:
+            return
+        for queue in list(queues):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # 따라오지 못하는 구독자는 연결을 끊어 재접속하게 함 (Last-Event-ID로 이어받음)
+                queues.discard(queue)
+                self._close_queue(queue)
+        if not queues:
+            self._subscribers.pop(topic, None)
+
+    def _close_queue(self, queue: asyncio.Queue):
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def _notify(self, topic: str, event_id: str, message: str):
+        payload = json.dumps({"origin": self._origin, "topic": topic, "id": event_id, "message": message}, ensure_ascii=False)
+        if len(payload.encode()) > NOTIFY_MAX_PAYLOAD:
+            logger.warning(f"Event payload too large for NOTIFY: {topic}")
+            return
+        with engine.connect() as conn:
+            conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": NOTIFY_CHANNEL, "payload": payload})
+            conn.commit()
+
+    def _listen(self):
+        """NOTIFY 수신 루프 (별도 스레드, 연결이 끊기면 재접속)"""
+        while not self._stopping.is_set():
+            raw = None
+            try:
+                raw = engine.raw_connection()
+                raw.detach()  # 풀 크기에 포함되지 않도록 분리
+                conn = raw.driver_connection
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                logger.info("Event listener connected")
+
+                while not self._stopping.is_set():
+                    self._receive(conn, 5.0)
+            except Exception as e:
+                logger.warning(f"Event listener error: {e}")
+                self._stopping.wait(settings.EVENTS_RECONNECT_DELAY)
+            finally:
+                if raw is not None:
+                    try:
+                        raw.close()
+                    except Exception:
+                        pass
+        self._listener = None
+
+    def _receive(self, conn, timeout: float):
+        """도착한 NOTIFY 처리 (최대 timeout초 대기, psycopg2 / psycopg 3 모두 지원)"""
+        if hasattr(conn, "poll"):
+            # psycopg2: 소켓이 읽기 가능해지면 poll() 후 notifies 목록에서 꺼냄
+            if select.select([conn], [], [], timeout) == ([], [], []):
+                return
+            conn.poll()
+            while conn.notifies:
+                self._on_notify(conn.notifies.pop(0).payload)
+        else:
+            # psycopg 3: notifies()는 timeout까지 알림을 내주는 제너레이터
+            for notify in conn.notifies(timeout=timeout):
+                self._on_notify(notify.payload)
+
+    def _on_notify(self, payload: str):
+        try:
+            notice = json.loads(payload)
+        except ValueError:
+            return
+        if notice.get("origin") == self._origin:
+            return
+        self._loop.call_soon_threadsafe(self._dispatch, notice["topic"], notice["id"], notice["message"])
+
+broker = EventBroker()
@@ -0,0 +1,215 @@
+# core/ranking.py
+import logging
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..models import Post, PostRanking
+from .user_directory import user_directory
+
+logger = logging.getLogger(__name__)
+
+CANDIDATE_FACTOR = 10  # 상위 K개 외에 추적할 후보 배수
+RESCALE_LIMIT = 1e12  # 배율이 이보다 커지면 기준 시각 재설정
+
+class RankingBoard:
+    """증분 갱신되는 상위 K개 순위표
+
+    감쇠 점수는 기준 시각 t0 대비 e^(λ(t - t0)) 배율을 곱해 저장한다.
+    모든 항목이 같은 비율로 감쇠하므로 시간이 지나도 저장된 값을 고칠 필요가 없고,
+    점수는 증가만 하므로 '하한보다 크면 최하위와 교체' 규칙으로 상위 K개가 정확히 유지된다.
+    """
+
+    def __init__(self, capacity: int, half_life: Optional[float] = None):
+        self.capacity = capacity
+        self.decay = math.log(2) / half_life if half_life else 0.0
+        self._t0 = time.time()
+        self._scores = {}
+        self._top = set()
+        self._floor = 0.0  # 상위 K개 최저 점수 (낮게 어긋날 수는 있어도 높게 어긋나지 않음)
+        self._lock = threading.Lock()
+
+    def _scale(self, now: float) -> float:
+        return math.exp(self.decay * (now - self._t0)) if self.decay else 1.0
+
+    def decayed(self, score: float, since: float, now: float) -> float:
+        """since 시각의 점수를 now 시각 기준으로 환산"""
+        return score * math.exp(-self.decay * (now - since))
+
+    def tracked_ids(self) -> set:
+        with self._lock:
+            return set(self._scores)
+
+    def add(self, post_id: int, weight: float, now: Optional[float] = None):
+        """점수 가산 (감쇠 순위표는 현재 시각 기준 가중치)"""
+        now = now or time.time()
+        with self._lock:
+            scale = self._scale(now)
+            if scale > RESCALE_LIMIT:
+                self._rebase(now)
+                scale = 1.0
+            self._set(post_id, self._scores.get(post_id, 0.0) + weight * scale)
+
+    def raise_to(self, post_id: int, score: float):
+        """감쇠 없는 순위표의 누적 점수 갱신 (예: 조회수)"""
+        with self._lock:
+            if score > self._scores.get(post_id, 0.0):
+                self._set(post_id, score)
+
+    def remove(self, post_id: int):
+        with self._lock:
+            self._scores.pop(post_id, None)
+            if post_id in self._top:
+                self._top.discard(post_id)
+                # 빈자리는 후보 중 최고 점수로 채움
+                candidates = [pid for pid in self._scores if pid not in self._top]
+                if candidates:
+                    self._top.add(max(candidates, key=self._scores.__getitem__))
+                self._refresh_floor()
+
+    def top(self, limit: int, now: Optional[float] = None) -> list:
+        """현재 시각 기준 (post_id, 점수) 상위 목록"""
+        now = now or time.time()
+        with self._lock:
+            scale = self._scale(now)
+            ranked = sorted(self._top, key=self._scores.__getitem__, reverse=True)[:limit]
+            return [(post_id, self._scores[post_id] / scale) for post_id in ranked]
+
+    def snapshot(self, now: Optional[float] = None) -> list:
+        """체크포인트용 후보 전체의 현재 점수"""
+        now = now or time.time()
+        with self._lock:
+            scale = self._scale(now)
+            return [(post_id, score / scale) for post_id, score in self._scores.items()]
+
+    def _set(self, post_id: int, score: float):
+        self._scores[post_id] = score
+        if post_id not in self._top:
+            if len(self._top) < self.capacity:
+                self._top.add(post_id)
+                self._refresh_floor()
+            elif score > self._floor:
+                weakest = min(self._top, key=self._scores.__getitem__)
+                if score > self._scores[weakest]:
+                    self._top.discard(weakest)
+                    self._top.add(post_id)
+                self._refresh_floor()
+
+        if len(self._scores) > self.capacity * CANDIDATE_FACTOR:
+            self._prune()
+
+    def _refresh_floor(self):
+        self._floor = min((self._scores[pid] for pid in self._top), default=0.0) if len(self._top) >= self.capacity else 0.0
+
+    def _prune(self):
+        """후보가 너무 많으면 하위 절반 제거 (상위 K개는 유지)"""
+        keep = self.capacity * CANDIDATE_FACTOR // 2
+        survivors = sorted(self._scores, key=self._scores.__getitem__, reverse=True)[:keep]
+        self._scores = {pid: self._scores[pid] for pid in set(survivors) | self._top}
+
+    def _rebase(self, now: float):
+        scale = self._scale(now)
+        self._scores = {pid: score / scale for pid, score in self._scores.items()}
+        self._t0 = now
+        self._refresh_floor()
+
+class PostRankingService:
+    """인기(누적 조회수) / 트렌딩(조회·댓글·작성 시각 감쇠) 게시글 순위"""
+
+    FEEDS = ("popular", "trending")
+
+    def __init__(self):
+        self.popular = RankingBoard(settings.RANKING_SIZE)
+        self.trending = RankingBoard(settings.RANKING_SIZE, settings.RANKING_HALF_LIFE)
+        self._posts = {}  # post_id -> 목록 표시용 정보 (작성자 이름은 조회 시 user_directory에서)
+
+    def board(self, feed: str) -> RankingBoard:
+        return self.popular if feed == "popular" else self.trending
+
+    def record_post(self, post: dict):
+        """새 게시글 (최신성 가중치)"""
+        self._remember(post)
+        self.trending.add(post["id"], settings.RANKING_POST_WEIGHT)
+
+    def record_view(self, post: dict):
+        """게시글 조회 (post는 증가 후 view_count를 포함한 상세 응답)"""
+        self._remember(post)
+        self.popular.raise_to(post["id"], post["view_count"])
+        self.trending.add(post["id"], settings.RANKING_VIEW_WEIGHT)
+
+    def record_comment(self, post_id: int):
+        self.trending.add(post_id, settings.RANKING_COMMENT_WEIGHT)
+
+    def update_title(self, post_id: int, title: str):
+        if post_id in self._posts:
+            self._posts[post_id]["title"] = title
+
+    def forget(self, post_id: int):
+        self.popular.remove(post_id)
+        self.trending.remove(post_id)
+        self._posts.pop(post_id, None)
+
+    def feed(self, db: Session, feed: str, limit: int) -> list:
+        """메모리의 상위 목록 반환 (표시 정보가 없는 글만 한 번에 조회, 작성자 이름은 항상 최신값)"""
+        ranked = self.board(feed).top(limit)
+        missing = [post_id for post_id, _ in ranked if post_id not in self._posts]
+        if missing:
+            self._load_posts(db, missing)
+
+        entries = [(self._posts[post_id], score) for post_id, score in ranked if post_id in self._posts]  # 삭제된 글 제외
+        usernames = user_directory.usernames(db, [info["author_id"] for info, _ in entries])
+        return [
+            {**info, "author_username": usernames.get(info["author_id"]), "score": round(score, 3)}
+            for info, score in entries
+        ]
+
+    def load(self, db: Session):
+        """시작 시 인기 순위는 조회수, 트렌딩 순위는 체크포인트로 복원"""
+        rows = db.query(Post.id, Post.view_count).order_by(Post.view_count.desc()).limit(settings.RANKING_SIZE).all()
+        for post_id, view_count in rows:
+            self.popular.raise_to(post_id, view_count or 0)
+
+        now = time.time()
+        checkpoint = db.query(PostRanking).filter(PostRanking.feed == "trending").all()
+        for row in checkpoint:
+            # 저장 시점 점수를 현재 기준 가중치로 환산
+            self.trending.add(row.post_id, self.trending.decayed(row.score, row.scored_at.timestamp(), now), now)
+        logger.info(f"Rankings loaded: {len(rows)} popular, {len(checkpoint)} trending")
+
+    def checkpoint(self, db: Session):
+        """트렌딩 후보 점수를 테이블에 저장"""
+        scored_at = datetime.now()
+        snapshot = self.trending.snapshot(scored_at.timestamp())
+        # 다른 워커에서 삭제된 글 제외
+        existing = {row.id for row in db.query(Post.id).filter(Post.id.in_([post_id for post_id, _ in snapshot]))}
+        snapshot = [(post_id, score) for post_id, score in snapshot if post_id in existing]
+        db.query(PostRanking).filter(PostRanking.feed == "trending").delete(synchronize_session=False)
+        if snapshot:
+            db.bulk_insert_mappings(PostRanking, [
+                {"feed": "trending", "post_id": post_id, "score": score, "scored_at": scored_at}
+                for post_id, score in snapshot
+            ])
+        db.commit()
+
+    def _remember(self, post: dict):
+        self._posts[post["id"]] = {key: post[key] for key in ("id", "title", "created_at", "author_id")}
+        if len(self._posts) > settings.RANKING_SIZE * CANDIDATE_FACTOR * 2:
+            tracked = self.popular.tracked_ids() | self.trending.tracked_ids()
+            self._posts = {pid: info for pid, info in self._posts.items() if pid in tracked}
+
+    def _load_posts(self, db: Session, post_ids: list):
+        rows = db.query(
+            Post.id, Post.title, Post.created_at, Post.author_id
+        ).filter(Post.id.in_(post_ids)).all()
+        for row in rows:
+            self._posts[row.id] = {
+                "id": row.id,
+                "title": row.title,
+                "created_at": row.created_at,
+                "author_id": row.author_id
+            }
+
+ranking = PostRankingService()
@@ -0,0 +1,96 @@
+# core/suggest.py
+import bisect
+import logging
+import threading
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..models import Post
+from ..utils.hangul import normalize_text, decompose, choseong, is_choseong_query
+
+logger = logging.getLogger(__name__)
+
+class TitleSuggestIndex:
+    """게시글 제목 자동완성용 메모리 접두사 색인
+
+    제목의 각 단어 위치부터 끝까지를 자모 분해 키와 초성 키로 만들어 정렬 배열에 보관하고,
+    검색어 접두사는 이진 탐색으로 찾는다. 항목은 (키, 단어 위치, 게시글 ID) 튜플이다.
+    """
+
+    def __init__(self):
+        self._jamo = []
+        self._choseong = []
+        self._titles = {}
+        self._lock = threading.Lock()
+
+    def _entries(self, post_id: int, title: str) -> tuple:
+        words = normalize_text(title).split(" ")[:settings.SUGGEST_MAX_WORDS]
+        jamo_entries, choseong_entries = [], []
+        for position in range(len(words)):
+            tail = " ".join(words[position:])
+            jamo_entries.append((decompose(tail), position, post_id))
+            choseong_entries.append((choseong(tail), position, post_id))
+        return jamo_entries, choseong_entries
+
+    def load(self, db: Session):
+        """전체 제목으로 색인 재구성 (다른 워커의 변경 반영, 교체는 원자적)"""
+        jamo, chosung, titles = [], [], {}
+        for post_id, title in db.query(Post.id, Post.title).yield_per(1000):
+            titles[post_id] = title
+            jamo_entries, choseong_entries = self._entries(post_id, title)
+            jamo.extend(jamo_entries)
+            chosung.extend(choseong_entries)
+        jamo.sort()
+        chosung.sort()
+
+        with self._lock:
+            self._jamo, self._choseong, self._titles = jamo, chosung, titles
+        logger.info(f"Title suggest index loaded: {len(titles)} posts, {len(jamo)} keys")
+
+    def add(self, post_id: int, title: str):
+        jamo_entries, choseong_entries = self._entries(post_id, title)
+        with self._lock:
+            if post_id in self._titles:
+                self._remove_locked(post_id)
+            self._titles[post_id] = title
+            for entry in jamo_entries:
+                bisect.insort(self._jamo, entry)
+            for entry in choseong_entries:
+                bisect.insort(self._choseong, entry)
+
+    def remove(self, post_id: int):
+        with self._lock:
+            self._remove_locked(post_id)
+
+    def _remove_locked(self, post_id: int):
+        title = self._titles.pop(post_id, None)
+        if title is None:
+            return
+        jamo_entries, choseong_entries = self._entries(post_id, title)
+        for entries, index in ((jamo_entries, self._jamo), (choseong_entries, self._choseong)):
+            for entry in entries:
+                position = bisect.bisect_left(index, entry)
+                if position < len(index) and index[position] == entry:
+                    del index[position]
+
+    def suggest(self, prefix: str, limit: int) -> list:
+        """접두사와 일치하는 제목 (제목 첫 단어 일치 우선, 같으면 최신 글 우선)"""
+        query = normalize_text(prefix)
+        if not query:
+            return []
+        if is_choseong_query(query):
+            index, key = self._choseong, choseong(query)
+        else:
+            index, key = self._jamo, decompose(query)
+
+        best = {}
+        with self._lock:
+            start = bisect.bisect_left(index, (key,))
+            for entry_key, position, post_id in index[start:start + settings.SUGGEST_SCAN_LIMIT]:
+                if not entry_key.startswith(key):
+                    break
+                if post_id not in best or position < best[post_id]:
+                    best[post_id] = position
+            ranked = sorted(best, key=lambda post_id: (best[post_id], -post_id))[:limit]
+            return [{"id": post_id, "title": self._titles[post_id]} for post_id in ranked]
+
+suggest_index = TitleSuggestIndex()
@@ -0,0 +1,82 @@
+# core/user_directory.py
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..models import User
+
+logger = logging.getLogger(__name__)
+
+class UserDirectory:
+    """사용자 ID -> 공개 프로필(이름) 프로세스 내 LRU 캐시
+
+    작성자 이름은 거의 바뀌지 않으므로 페이지에 나온 작성자 중 캐시에 없는 사용자만
+    IN (...) 한 번으로 채운다. 이름 변경 시 무효화하고, 다른 워커의 변경은 TTL이 지나면 반영된다.
+    """
+
+    def __init__(self, capacity: int, ttl: float):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries = OrderedDict()  # user_id -> (프로필, 적재 시각)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def profiles(self, db: Session, user_ids: Iterable[str]) -> dict:
+        """user_id -> {"id", "username"} (없는 사용자는 제외)"""
+        now = time.time()
+        result, missing = {}, []
+        with self._lock:
+            for user_id in set(user_ids):
+                if user_id is None:
+                    continue
+                entry = self._entries.get(user_id)
+                if entry and now - entry[1] < self.ttl:
+                    self._entries.move_to_end(user_id)
+                    result[user_id] = entry[0]
+                else:
+                    missing.append(user_id)
+            self.hits += len(result)
+            self.misses += len(missing)
+
+        if missing:
+            # 비밀번호 해시 등은 읽지 않도록 공개 컬럼만 조회
+            rows = db.query(User.id, User.username).filter(User.id.in_(missing)).all()
+            loaded = {row.id: {"id": row.id, "username": row.username} for row in rows}
+            self._store(loaded, now)
+            result.update(loaded)
+        return result
+
+    def usernames(self, db: Session, user_ids: Iterable[str]) -> dict:
+        """user_id -> 이름"""
+        return {user_id: profile["username"] for user_id, profile in self.profiles(db, user_ids).items()}
+
+    def username(self, db: Session, user_id: str) -> Optional[str]:
+        return self.usernames(db, [user_id]).get(user_id)
+
+    def invalidate(self, user_id: str):
+        """프로필 변경 시 호출"""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def warm(self, db: Session):
+        """활동이 많은 사용자부터 미리 적재"""
+        rows = db.query(User.id, User.username).order_by(
+            (func.coalesce(User.post_count, 0) + func.coalesce(User.comment_count, 0)).desc()
+        ).limit(self.capacity).all()
+        self._store({row.id: {"id": row.id, "username": row.username} for row in rows}, time.time())
+        logger.info(f"User directory warmed: {len(rows)} users")
+
+    def _store(self, profiles: dict, now: float):
+        with self._lock:
+            for user_id, profile in profiles.items():
+                self._entries[user_id] = (profile, now)
+                self._entries.move_to_end(user_id)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+user_directory = UserDirectory(settings.USER_DIRECTORY_SIZE, settings.USER_DIRECTORY_TTL)
@@ -1,22 +1,79 @@
 # database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
 import logging
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+IS_SQLITE = make_url(settings.DATABASE_URL).get_backend_name() == "sqlite"
+
+def _postgres_connect_args() -> dict:
+    """연결별 서버 측 준비된 문장 캐시 (psycopg 3 드라이버에서만 지원, psycopg2는 매번 파싱)"""
+    if make_url(settings.DATABASE_URL).get_driver_name() != "psycopg":
+        return {}
+    return {"prepare_threshold": settings.DB_PREPARE_THRESHOLD}
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """SQLite 연결마다 WAL 및 성능 관련 PRAGMA 적용"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")  # ON DELETE CASCADE 적용
+    cursor.close()
+
+def _create_engine():
+    """DATABASE_URL에 맞는 엔진 생성 (PostgreSQL / SQLite)"""
+    if not IS_SQLITE:
+        return create_engine(
+            settings.DATABASE_URL,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            connect_args=_postgres_connect_args(),
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+            echo=settings.DB_ECHO
+        )
+    
+    database = make_url(settings.DATABASE_URL).database
+    connect_args = {
+        "check_same_thread": False,
+        "timeout": settings.SQLITE_BUSY_TIMEOUT / 1000,
+        "cached_statements": settings.SQLITE_STATEMENT_CACHE
+    }
+    if not database or database == ":memory:":
+        # 메모리 DB는 연결 하나를 공유해야 같은 데이터를 봄
+        sqlite_engine = create_engine(
+            settings.DATABASE_URL,
+            connect_args=connect_args,
+            poolclass=StaticPool,
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+            echo=settings.DB_ECHO
+        )
+    else:
+        # WAL 모드는 읽기 동시 처리가 가능하므로 연결 풀 유지
+        sqlite_engine = create_engine(
+            settings.DATABASE_URL,
+            connect_args=connect_args,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+            echo=settings.DB_ECHO
+        )
+    event.listen(sqlite_engine, "connect", _set_sqlite_pragmas)
+    return sqlite_engine
+
 # SQLAlchemy 엔진 생성
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    pool_pre_ping=settings.DB_POOL_PRE_PING,
-    echo=settings.DB_ECHO
-)
+engine = _create_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -24,14 +81,27 @@ Base = declarative_base()
 def init_database():
     """데이터베이스 초기화 및 테이블 생성"""
     try:
+        from sqlalchemy import inspect
+        
         # 데이터베이스 연결 테스트
         with engine.connect() as conn:
             logger.info("Database connection successful")
         
+        existing_tables = set(inspect(engine).get_table_names())
+        
         # 테이블 생성 (이미 존재하면 무시)
         Base.metadata.create_all(bind=engine, checkfirst=True)
         logger.info("Database tables created successfully")
         
+        # 업로드 참조 인덱스가 새로 생성되었으면 기존 게시글로 채움
+        if 'posts' in existing_tables and 'post_uploads' not in existing_tables:
+            from .utils.upload_refs import reindex_post_uploads
+            db = SessionLocal()
+            try:
+                reindex_post_uploads(db)
+            finally:
+                db.close()
+        
     except OperationalError as e:
         logger.error(f"Database connection failed: {e}")
         raise Exception("Database connection failed")
@@ -39,32 +109,177 @@ def init_database():
         logger.error(f"Database initialization failed: {e}")
         raise Exception("Database initialization failed")
 
+def _qualified(table: str) -> str:
+    """마이그레이션 SQL용 테이블 이름 (PostgreSQL은 스키마 포함)"""
+    return table if IS_SQLITE else f"{settings.DB_SCHEMA}.{table}"
+
+def _migrate_sqlite_autoincrement(existing_tables):
+    """기존 SQLite 게시글/댓글 테이블을 AUTOINCREMENT로 재구성
+
+    AUTOINCREMENT가 없으면 SQLite는 최대 ID + 1을 다시 쓰므로 삭제·보관된 글이나 댓글의 ID가
+    새 행에 재사용된다. 재구성 후 sqlite_sequence를 보관된 ID까지 포함한 최댓값으로 맞춘다.
+    """
+    from sqlalchemy.schema import CreateTable, CreateIndex
+    from .utils.archive import archived_max_ids
+    
+    raw = engine.raw_connection()
+    try:
+        conn = raw.driver_connection
+        pending = []
+        for name in ("posts", "comments"):
+            if name not in existing_tables:
+                continue
+            ddl = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()[0]
+            if "AUTOINCREMENT" not in ddl.upper():
+                pending.append(name)
+        if not pending:
+            return
+        
+        db = SessionLocal()
+        try:
+            floors = archived_max_ids(db)
+        finally:
+            db.close()
+        
+        isolation_level = conn.isolation_level
+        conn.isolation_level = None  # BEGIN/COMMIT 직접 관리
+        conn.execute("PRAGMA foreign_keys=OFF")  # 재구성 중 CASCADE 삭제 방지 (트랜잭션 밖에서만 적용됨)
+        conn.execute("PRAGMA legacy_alter_table=ON")  # 다른 테이블의 FK가 임시 이름을 가리키지 않도록
+        try:
+            conn.execute("BEGIN")
+            for name in pending:
+                table = Base.metadata.tables[name]
+                indexes = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (name,)
+                ).fetchall()
+                for (index_name,) in indexes:
+                    conn.execute(f'DROP INDEX "{index_name}"')
+                conn.execute(f"ALTER TABLE {name} RENAME TO {name}_old")
+                conn.execute(str(CreateTable(table).compile(dialect=engine.dialect)))
+                for index in table.indexes:
+                    conn.execute(str(CreateIndex(index).compile(dialect=engine.dialect)))
+                
+                old_columns = {row[1] for row in conn.execute(f"PRAGMA table_info({name}_old)")}
+                columns = ", ".join(column.name for column in table.columns if column.name in old_columns)
+                conn.execute(f"INSERT INTO {name} ({columns}) SELECT {columns} FROM {name}_old")
+                conn.execute(f"DROP TABLE {name}_old")
+                
+                max_id = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {name}").fetchone()[0]
+                conn.execute("DELETE FROM sqlite_sequence WHERE name = ?", (name,))
+                conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (name, max(max_id, floors[name])))
+                logger.info(f"Rebuilt {name} table with AUTOINCREMENT")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.execute("PRAGMA legacy_alter_table=OFF")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.isolation_level = isolation_level
+    finally:
+        raw.close()
+
 def check_and_migrate_schema():
     """스키마 변경사항 체크 및 마이그레이션"""
     try:
-        from sqlalchemy import inspect
+        from sqlalchemy import inspect, text
         inspector = inspect(engine)
         
         # 기존 테이블 구조 확인
-        existing_tables = inspector.get_table_names(schema='board')
+        schema = None if IS_SQLITE else settings.DB_SCHEMA
+        existing_tables = inspector.get_table_names(schema=schema)
         
         # 필요한 컬럼이 있는지 확인하고 없으면 추가
         if 'posts' in existing_tables:
-            columns = [col['name'] for col in inspector.get_columns('posts', schema='board')]
+            columns = [col['name'] for col in inspector.get_columns('posts', schema=schema)]
+            posts_table = _qualified('posts')
             
             with engine.connect() as conn:
                 # view_count 컬럼이 없으면 추가
                 if 'view_count' not in columns:
-                    conn.execute('ALTER TABLE board.posts ADD COLUMN view_count INTEGER DEFAULT 0')
+                    conn.execute(text(f'ALTER TABLE {posts_table} ADD COLUMN view_count INTEGER DEFAULT 0'))
                     logger.info("Added view_count column to posts table")
                 
                 # updated_at 컬럼이 없으면 추가
                 if 'updated_at' not in columns:
-                    conn.execute('ALTER TABLE board.posts ADD COLUMN updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP')
+                    # SQLite는 ADD COLUMN에 CURRENT_TIMESTAMP 기본값을 허용하지 않음
+                    default = '' if IS_SQLITE else ' DEFAULT CURRENT_TIMESTAMP'
+                    conn.execute(text(f'ALTER TABLE {posts_table} ADD COLUMN updated_at TIMESTAMP{default}'))
                     logger.info("Added updated_at column to posts table")
                 
+                # revision 컬럼이 없으면 추가 (기존 글은 리비전 0)
+                if 'revision' not in columns:
+                    conn.execute(text(f'ALTER TABLE {posts_table} ADD COLUMN revision INTEGER NOT NULL DEFAULT 0'))
+                    logger.info("Added revision column to posts table")
+                
+                # excerpt 컬럼이 없으면 추가 (기존 글은 아래에서 채움)
+                if 'excerpt' not in columns:
+                    conn.execute(text(f'ALTER TABLE {posts_table} ADD COLUMN excerpt TEXT'))
+                    logger.info("Added excerpt column to posts table")
+                
                 conn.commit()
             
+            # 요약이 비어 있는 기존 게시글 채우기
+            from .utils.backfill import backfill_post_excerpts
+            db = SessionLocal()
+            try:
+                backfill_post_excerpts(db)
+            finally:
+                db.close()
+        
+        if 'comments' in existing_tables:
+            columns = [col['name'] for col in inspector.get_columns('comments', schema=schema)]
+            comments_table = _qualified('comments')
+            path_type = 'VARCHAR(255)' if IS_SQLITE else 'VARCHAR(255) COLLATE "C"'
+            
+            with engine.connect() as conn:
+                # 스레드 구조 컬럼이 없으면 추가 (기존 댓글은 아래에서 루트 댓글로 채움)
+                for name, ddl in (('parent_id', 'INTEGER'), ('path', path_type),
+                                  ('depth', 'INTEGER DEFAULT 0'), ('reply_count', 'INTEGER DEFAULT 0')):
+                    if name not in columns:
+                        conn.execute(text(f'ALTER TABLE {comments_table} ADD COLUMN {name} {ddl}'))
+                        logger.info(f"Added {name} column to comments table")
+                
+                conn.commit()
+            
+            from .utils.backfill import backfill_comment_paths
+            db = SessionLocal()
+            try:
+                backfill_comment_paths(db)
+            finally:
+                db.close()
+        
+        if 'users' in existing_tables:
+            columns = [col['name'] for col in inspector.get_columns('users', schema=schema)]
+            users_table = _qualified('users')
+            added = False
+            
+            with engine.connect() as conn:
+                # 활동 수 컬럼이 없으면 추가 후 아래에서 집계
+                for name in ('post_count', 'comment_count'):
+                    if name not in columns:
+                        conn.execute(text(f'ALTER TABLE {users_table} ADD COLUMN {name} INTEGER DEFAULT 0'))
+                        logger.info(f"Added {name} column to users table")
+                        added = True
+                
+                conn.commit()
+            
+            if added:
+                from .utils.backfill import backfill_user_counts
+                db = SessionLocal()
+                try:
+                    backfill_user_counts(db)
+                finally:
+                    db.close()
+        
+        if IS_SQLITE:
+            _migrate_sqlite_autoincrement(existing_tables)
+        
+        # 기존 테이블에 새로 정의된 인덱스 생성
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=engine, checkfirst=True)
+            
     except Exception as e:
         logger.warning(f"Schema migration warning: {e}")
 
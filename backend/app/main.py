@@ -2,13 +2,24 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
+import asyncio
 import logging
 import os
+from starlette.concurrency import run_in_threadpool
 
 from .config import settings
 from .database import init_database, check_and_migrate_schema
-from .api import auth_router, posts_router, comments_router, upload_router
+from .api import auth_router, posts_router, comments_router, upload_router, events_router, users_router
+from .core import AdmissionControlMiddleware, CompressionMiddleware
+from .core.events import broker
+from .core.ranking import ranking
+from .core.suggest import suggest_index
+from .core.user_directory import user_directory
+from .database import SessionLocal
+from .utils.upload_gc import run_sweep_cycle
+from .utils.archive import run_archive_cycle
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +32,9 @@ app = FastAPI(
     version=settings.APP_VERSION
 )
 
+# 요청 제어 미들웨어 설정 (CORS 헤더가 거부 응답에도 붙도록 먼저 등록)
+app.add_middleware(AdmissionControlMiddleware)
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
@@ -30,6 +44,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 미들웨어 설정 (가장 바깥에서 모든 응답에 적용)
+app.add_middleware(CompressionMiddleware)
+
 # 업로드 디렉터리 생성 및 정적 파일 서빙
 if not os.path.exists(settings.UPLOAD_DIR):
     os.makedirs(settings.UPLOAD_DIR)
@@ -41,6 +58,8 @@ app.include_router(auth_router, prefix="/api")
 app.include_router(posts_router, prefix="/api")  
 app.include_router(comments_router, prefix="/api")
 app.include_router(upload_router, prefix="/api")
+app.include_router(events_router, prefix="/api")
+app.include_router(users_router, prefix="/api")
 
 # 시작 이벤트
 @app.on_event("startup")
@@ -50,11 +69,81 @@ async def startup_event():
     try:
         init_database()
         check_and_migrate_schema()
+        await broker.start()
+        with_session(ranking.load)
+        with_session(suggest_index.load)
+        if settings.USER_DIRECTORY_WARM:
+            with_session(user_directory.warm)
+        asyncio.create_task(ranking_checkpoint_loop())
+        asyncio.create_task(suggest_refresh_loop())
+        if settings.UPLOAD_GC_ENABLED:
+            asyncio.create_task(upload_gc_loop())
+        if settings.ARCHIVE_ENABLED:
+            asyncio.create_task(archive_loop())
         logger.info("Application started successfully")
     except Exception as e:
         logger.error(f"Failed to start application: {e}")
         raise
 
+def with_session(task):
+    """별도 DB 세션으로 작업 실행"""
+    db = SessionLocal()
+    try:
+        task(db)
+    finally:
+        db.close()
+
+async def ranking_checkpoint_loop():
+    """트렌딩 순위 주기적 체크포인트"""
+    while True:
+        await asyncio.sleep(settings.RANKING_CHECKPOINT_INTERVAL)
+        try:
+            await run_in_threadpool(with_session, ranking.checkpoint)
+        except Exception as e:
+            logger.warning(f"Ranking checkpoint failed: {e}")
+
+async def suggest_refresh_loop():
+    """제목 자동완성 색인 주기적 재구성"""
+    while True:
+        await asyncio.sleep(settings.SUGGEST_REFRESH_INTERVAL)
+        try:
+            await run_in_threadpool(with_session, suggest_index.load)
+        except Exception as e:
+            logger.warning(f"Suggest index refresh failed: {e}")
+
+async def upload_gc_loop():
+    """고아 업로드 파일 주기적 정리 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
+    while True:
+        await asyncio.sleep(settings.UPLOAD_GC_INTERVAL)
+        try:
+            await run_in_threadpool(run_sweep_cycle)
+        except Exception as e:
+            logger.warning(f"Upload GC failed: {e}")
+
+def archive_old_posts(db):
+    """보관 정책 실행 후 보관된 글은 순위와 자동완성에서 제외"""
+    for post_id in run_archive_cycle(db)["archived"]:
+        ranking.forget(post_id)
+        suggest_index.remove(post_id)
+
+async def archive_loop():
+    """오래된 게시글 주기적 보관"""
+    while True:
+        await asyncio.sleep(settings.ARCHIVE_INTERVAL)
+        try:
+            await run_in_threadpool(with_session, archive_old_posts)
+        except Exception as e:
+            logger.warning(f"Post archiving failed: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """앱 종료 시 이벤트 구독 정리 및 순위 저장"""
+    await broker.stop()
+    try:
+        with_session(ranking.checkpoint)
+    except Exception as e:
+        logger.warning(f"Ranking checkpoint failed: {e}")
+
 # 에러 핸들러
 @app.exception_handler(SQLAlchemyError)
 async def sqlalchemy_exception_handler(request, exc):
@@ -73,7 +162,7 @@ async def health_check():
     try:
         from .database import engine
         with engine.connect() as conn:
-            conn.execute("SELECT 1")
+            conn.execute(text("SELECT 1"))
         return {"status": "healthy", "database": "connected"}
     except Exception as e:
         logger.error(f"Health check failed: {e}")
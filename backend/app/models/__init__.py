@@ -2,5 +2,9 @@
 from .user import User
 from .post import Post  
 from .comment import Comment
+from .upload import PostUpload
+from .ranking import PostRanking
+from .revision import PostRevision
+from .archive import PostArchive, ArchivedUpload
 
-__all__ = ["User", "Post", "Comment"]
+__all__ = ["User", "Post", "Comment", "PostUpload", "PostRanking", "PostRevision", "PostArchive", "ArchivedUpload"]
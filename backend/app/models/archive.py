@@ -0,0 +1,26 @@
+# models/archive.py
+from sqlalchemy import Column, String, Integer, DateTime, LargeBinary, ForeignKey
+from datetime import datetime
+from ..database import Base
+
+class PostArchive(Base):
+    """보관 계층으로 옮긴 오래된 게시글 (본문, 댓글, 수정 이력을 압축해 한 행에 저장)"""
+    __tablename__ = "post_archive"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)  # 원래 게시글 ID
+    title = Column(String(200), nullable=False)
+    author_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    view_count = Column(Integer, default=0)
+    revision = Column(Integer, default=0)
+    comment_count = Column(Integer, default=0)
+    archived_at = Column(DateTime, default=datetime.now)
+    data = Column(LargeBinary, nullable=False)  # zlib 압축 JSON (utils/archive.py 참고)
+
+class ArchivedUpload(Base):
+    """보관된 게시글이 참조하는 업로드 파일 (고아 파일 정리에서 제외)"""
+    __tablename__ = "post_archive_uploads"
+    
+    post_id = Column(Integer, ForeignKey("post_archive.id", ondelete="CASCADE"), primary_key=True)
+    filename = Column(String, primary_key=True, index=True)
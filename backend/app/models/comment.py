@@ -1,11 +1,19 @@
 # models/comment.py
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
 
+# path 범위 조회가 인덱스를 타도록 PostgreSQL에서는 바이트 순서(C) 정렬 사용
+PathType = String(255).with_variant(String(255, collation="C"), "postgresql")
+
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_post_path", "post_id", "path"),
+        Index("ix_comments_author_created", "author_id", "created_at", "id"),  # 사용자별 댓글 목록
+        {"sqlite_autoincrement": True},  # ID가 path에 들어가므로 삭제·보관된 ID 재사용 방지
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     content = Column(Text, nullable=False)
@@ -14,6 +22,12 @@ class Comment(Base):
     author_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"))
     post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"))
     
+    # 스레드 구조 (materialized path, utils/comment_tree.py 참고)
+    parent_id = Column(Integer, ForeignKey("comments.id", ondelete="CASCADE"), nullable=True)
+    path = Column(PathType)
+    depth = Column(Integer, default=0)
+    reply_count = Column(Integer, default=0)  # 직계 답글 수
+    
     # 관계 설정
     author = relationship("User", back_populates="comments")
     post = relationship("Post", back_populates="comments")
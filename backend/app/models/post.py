@@ -1,20 +1,30 @@
 # models/post.py
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Index
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 from ..database import Base
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_author_created", "author_id", "created_at", "id"),  # 사용자별 글 목록
+        {"sqlite_autoincrement": True},  # 삭제·보관된 글의 ID를 SQLite가 재사용하지 않도록
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(200), nullable=False)
-    content = Column(Text, nullable=False)
+    content = deferred(Column(Text, nullable=False))  # 상세 조회에서만 로드
+    excerpt = Column(Text)  # 목록/검색용 일반 텍스트 요약
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
-    view_count = Column(Integer, default=0)
+    view_count = Column(Integer, default=0, index=True)
     author_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"))
+    revision = Column(Integer, nullable=False, default=0)  # 수정 시마다 증가 (낙관적 동시성)
     
     # 관계 설정
     author = relationship("User", back_populates="posts")
-    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
+    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan", passive_deletes=True)  # 답글 트리는 DB에서 일괄 삭제
+    uploads = relationship("PostUpload", back_populates="post", cascade="all, delete-orphan")
+    
+    # ORM 수정 시 WHERE revision = 이전 값 조건으로 갱신, 충돌하면 StaleDataError
+    __mapper_args__ = {"version_id_col": revision}
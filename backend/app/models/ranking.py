@@ -0,0 +1,13 @@
+# models/ranking.py
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey
+from datetime import datetime
+from ..database import Base
+
+class PostRanking(Base):
+    """게시글 순위 점수 체크포인트 (재시작 시 메모리 순위표 복원용)"""
+    __tablename__ = "post_rankings"
+    
+    feed = Column(String(20), primary_key=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    score = Column(Float, nullable=False)
+    scored_at = Column(DateTime, default=datetime.now)
@@ -0,0 +1,15 @@
+# models/revision.py
+from sqlalchemy import Column, String, Integer, DateTime, Text, Boolean, ForeignKey
+from datetime import datetime
+from ..database import Base
+
+class PostRevision(Base):
+    """게시글 수정 이력 (주기적 전체 스냅샷 + 사이의 변경분)"""
+    __tablename__ = "post_revisions"
+    
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    revision = Column(Integer, primary_key=True)
+    title = Column(String(200), nullable=False)
+    is_snapshot = Column(Boolean, default=False)
+    data = Column(Text, nullable=False)  # 스냅샷이면 본문 전체, 아니면 직전 리비전 대비 변경 연산(JSON)
+    created_at = Column(DateTime, default=datetime.now)
@@ -0,0 +1,14 @@
+# models/upload.py
+from sqlalchemy import Column, String, Integer, ForeignKey
+from sqlalchemy.orm import relationship
+from ..database import Base
+
+class PostUpload(Base):
+    """게시글 본문이 참조하는 업로드 파일 (고아 파일 정리용 역참조 인덱스)"""
+    __tablename__ = "post_uploads"
+    
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    filename = Column(String, primary_key=True, index=True)
+    
+    # 관계 설정
+    post = relationship("Post", back_populates="uploads")
@@ -1,5 +1,5 @@
 # models/user.py
-from sqlalchemy import Column, String, DateTime
+from sqlalchemy import Column, String, Integer, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -11,6 +11,8 @@ class User(Base):
     username = Column(String, nullable=False)
     password = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.now)
+    post_count = Column(Integer, default=0)  # 작성/삭제 시 함께 갱신
+    comment_count = Column(Integer, default=0)
     
     # 관계 설정
     posts = relationship("Post", back_populates="author", cascade="all, delete-orphan")
@@ -1,12 +1,12 @@
 # schemas/__init__.py
-from .user import UserCreate, UserLogin
-from .post import PostCreate, PostUpdate, PostResponse
+from .user import UserCreate, UserLogin, UserUpdate
+from .post import PostCreate, PostUpdate, PostPatch, PostResponse
 from .comment import CommentCreate, CommentResponse
-from .upload import UploadResponse
+from .upload import UploadResponse, ResumableUploadCreate
 
 __all__ = [
-    "UserCreate", "UserLogin",
-    "PostCreate", "PostUpdate", "PostResponse", 
+    "UserCreate", "UserLogin", "UserUpdate",
+    "PostCreate", "PostUpdate", "PostPatch", "PostResponse", 
     "CommentCreate", "CommentResponse",
-    "UploadResponse"
+    "UploadResponse", "ResumableUploadCreate"
 ]
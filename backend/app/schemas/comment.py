@@ -6,6 +6,7 @@ from typing import Optional
 class CommentCreate(BaseModel):
     content: str
     post_id: int
+    parent_id: Optional[int] = None  # 답글인 경우 부모 댓글 ID
     
     class Config:
         str_strip_whitespace = True
@@ -17,3 +18,6 @@ class CommentResponse(BaseModel):
     updated_at: Optional[datetime] = None
     author_id: str
     author_username: str
+    parent_id: Optional[int] = None
+    depth: int = 0
+    reply_count: int = 0
@@ -1,7 +1,7 @@
 # schemas/post.py
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Tuple
 
 class PostCreate(BaseModel):
     title: str
@@ -17,6 +17,11 @@ class PostUpdate(BaseModel):
     class Config:
         str_strip_whitespace = True
 
+class PostPatch(BaseModel):
+    base_revision: int  # 수정 기준 리비전 (현재 리비전과 다르면 409)
+    title: Optional[str] = None
+    ops: List[Tuple[int, int, str]] = []  # [start, end, text]: 기준 본문의 start:end를 text로 치환 (코드 포인트 단위)
+
 class PostResponse(BaseModel):
     id: int
     title: str
@@ -24,5 +29,6 @@ class PostResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
     view_count: int = 0
+    revision: int = 0
     author_id: str
     author_username: str
@@ -1,5 +1,6 @@
 # schemas/upload.py
 from pydantic import BaseModel
+from typing import Optional
 
 class UploadResponse(BaseModel):
     url: str
@@ -7,3 +8,8 @@ class UploadResponse(BaseModel):
     size: int
     type: str
     mime_type: str
+
+class ResumableUploadCreate(BaseModel):
+    filename: str
+    size: int
+    mime_type: Optional[str] = None
@@ -15,3 +15,9 @@ class UserLogin(BaseModel):
     
     class Config:
         str_strip_whitespace = True
+
+class UserUpdate(BaseModel):
+    username: str
+    
+    class Config:
+        str_strip_whitespace = True
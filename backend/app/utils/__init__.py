@@ -1,4 +1,8 @@
 # utils/__init__.py
 from .file_utils import get_file_type, save_upload_file, validate_file_size
+from .upload_refs import extract_upload_refs, sync_post_uploads, reindex_post_uploads
 
-__all__ = ["get_file_type", "save_upload_file", "validate_file_size"]
+__all__ = [
+    "get_file_type", "save_upload_file", "validate_file_size",
+    "extract_upload_refs", "sync_post_uploads", "reindex_post_uploads"
+]
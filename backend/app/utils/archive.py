@@ -0,0 +1,274 @@
+# utils/archive.py
+"""
+오래된 게시글 보관 계층
+
+작성·수정·마지막 댓글 이후 ARCHIVE_AFTER_DAYS가 지난 게시글을 댓글, 수정 이력과 함께
+압축된 한 행(post_archive)으로 옮기고 원래 테이블에서 삭제한다.
+목록/검색/사용자별 목록은 posts 테이블만 보므로 자동으로 제외되고,
+상세 조회는 posts에 없을 때 보관 테이블을 읽는다 (읽기 전용).
+
+    python -m app.utils.archive --dry-run
+    python -m app.utils.archive --restore 123
+"""
+
+import argparse
+import json
+import logging
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import exists, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, undefer
+from ..config import settings
+from ..database import SessionLocal, IS_SQLITE
+from ..core.user_directory import user_directory
+from ..models import Post, Comment, User, PostUpload, PostRevision, PostArchive, ArchivedUpload
+from .user_counts import adjust_user_counts
+
+logger = logging.getLogger(__name__)
+
+COMMENT_FIELDS = ("id", "content", "created_at", "updated_at", "author_id", "parent_id", "path", "depth", "reply_count")
+REVISION_FIELDS = ("revision", "title", "is_snapshot", "data", "created_at")
+
+def _encode(payload: dict) -> bytes:
+    raw = json.dumps(payload, ensure_ascii=False, default=lambda value: value.isoformat())
+    return zlib.compress(raw.encode(), 9)
+
+def _decode(data: bytes) -> dict:
+    return json.loads(zlib.decompress(data).decode())
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+def _archivable(cutoff: datetime) -> tuple:
+    """보관 조건 (작성·수정·마지막 댓글이 모두 cutoff 이전)"""
+    recent_comment = exists().where(Comment.post_id == Post.id, Comment.created_at >= cutoff)
+    return (
+        Post.created_at < cutoff,
+        func.coalesce(Post.updated_at, Post.created_at) < cutoff,
+        ~recent_comment
+    )
+
+def archive_candidates(db: Session, cutoff: datetime, limit: int) -> list:
+    """보관 대상 게시글 ID"""
+    rows = db.query(Post.id).filter(*_archivable(cutoff)).order_by(Post.id).limit(limit).all()
+    return [row.id for row in rows]
+
+def _lock_post(db: Session, post_id: int):
+    """게시글 행 쓰기 잠금 (트랜잭션 끝까지 댓글 작성·수정이 끼어들지 못함)"""
+    if IS_SQLITE:
+        # SQLite는 FOR UPDATE가 없으므로 값이 바뀌지 않는 UPDATE로 쓰기 잠금을 먼저 잡음
+        db.query(Post).filter(Post.id == post_id).update(
+            {Post.updated_at: Post.updated_at}, synchronize_session=False
+        )
+    return db.query(Post).options(undefer(Post.content)).filter(Post.id == post_id).with_for_update().first()
+
+def archive_post(db: Session, post_id: int, cutoff: datetime) -> bool:
+    """게시글 하나를 보관 테이블로 이동 (커밋은 호출자가 수행)"""
+    post = _lock_post(db, post_id)
+    if not post:
+        return False
+    # 후보 선정 이후 댓글이나 수정이 있었을 수 있으므로 잠금 안에서 조건 재확인
+    if not db.query(exists().where(Post.id == post_id, *_archivable(cutoff))).scalar():
+        return False
+
+    comments = db.query(*[getattr(Comment, name) for name in COMMENT_FIELDS]).filter(
+        Comment.post_id == post_id
+    ).order_by(Comment.path).all()
+    revisions = db.query(*[getattr(PostRevision, name) for name in REVISION_FIELDS]).filter(
+        PostRevision.post_id == post_id
+    ).order_by(PostRevision.revision).all()
+    uploads = [row.filename for row in db.query(PostUpload.filename).filter(PostUpload.post_id == post_id)]
+
+    payload = {
+        "content": post.content,
+        "excerpt": post.excerpt,
+        "comments": [dict(row._mapping) for row in comments],
+        "revisions": [dict(row._mapping) for row in revisions]
+    }
+    db.add(PostArchive(
+        id=post.id,
+        title=post.title,
+        author_id=post.author_id,
+        created_at=post.created_at,
+        updated_at=post.updated_at,
+        view_count=post.view_count or 0,
+        revision=post.revision,
+        comment_count=len(comments),
+        data=_encode(payload)
+    ))
+    db.flush()
+    db.add_all([ArchivedUpload(post_id=post.id, filename=filename) for filename in uploads])
+
+    # 사용자별 글/댓글 목록은 보관된 글을 제외하므로 활동 수도 함께 맞춤
+    adjust_user_counts(db, User.post_count, {post.author_id: -1})
+    adjust_user_counts(db, User.comment_count, {author: -count for author, count in Counter(row.author_id for row in comments).items()})
+
+    # 댓글, 업로드 참조, 수정 이력, 순위 체크포인트는 FK ON DELETE CASCADE로 함께 삭제
+    db.query(Post).filter(Post.id == post_id).delete(synchronize_session=False)
+    return True
+
+def run_archive_cycle(db: Session, dry_run: bool = False, limit: Optional[int] = None) -> dict:
+    """보관 정책 1회 실행, 보관한 게시글 ID 목록 포함 보고서 반환"""
+    cutoff = datetime.now() - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+    candidates = archive_candidates(db, cutoff, limit or settings.ARCHIVE_BATCH_SIZE)
+    report = {"dry_run": dry_run, "cutoff": cutoff.isoformat(), "archived": []}
+    if dry_run:
+        report["archived"] = candidates
+        return report
+
+    for post_id in candidates:
+        try:
+            if archive_post(db, post_id, cutoff):
+                db.commit()
+                report["archived"].append(post_id)
+            else:
+                db.rollback()  # 잠금 해제
+        except IntegrityError:
+            # 다른 워커가 먼저 보관한 경우
+            db.rollback()
+
+    if report["archived"]:
+        logger.info(f"Archived {len(report['archived'])} posts older than {cutoff.date()}")
+    return report
+
+def load_archived_post(db: Session, post_id: int) -> Optional[dict]:
+    """보관된 게시글 상세와 댓글 목록 (작성자 이름 포함), 없으면 None"""
+    archived = db.query(PostArchive).filter(PostArchive.id == post_id).first()
+    if not archived:
+        return None
+
+    payload = _decode(archived.data)
+    comments = payload["comments"]
+
+    # 글과 댓글 작성자 이름은 한 번에 조회
+    usernames = user_directory.usernames(db, [archived.author_id] + [comment["author_id"] for comment in comments])
+
+    return {
+        "post": {
+            "id": archived.id,
+            "title": archived.title,
+            "content": payload["content"],
+            "created_at": archived.created_at,
+            "updated_at": archived.updated_at,
+            "view_count": archived.view_count or 0,
+            "revision": archived.revision,
+            "author_id": archived.author_id,
+            "author_username": usernames.get(archived.author_id),
+            "archived": True,
+            "archived_at": archived.archived_at
+        },
+        "comments": [{
+            "id": comment["id"],
+            "content": comment["content"],
+            "created_at": comment["created_at"],
+            "updated_at": comment["updated_at"],
+            "author_id": comment["author_id"],
+            "author_username": usernames.get(comment["author_id"]),
+            "parent_id": comment["parent_id"],
+            "depth": comment["depth"] or 0,
+            "reply_count": comment["reply_count"] or 0,
+            "path": comment["path"]
+        } for comment in comments]
+    }
+
+def archived_max_ids(db: Session) -> dict:
+    """보관된 게시글/댓글의 최대 ID (테이블 재구성 시 ID 재사용 방지 기준)"""
+    max_comment_id = 0
+    for (data,) in db.query(PostArchive.data).yield_per(100):
+        for comment in _decode(data)["comments"]:
+            max_comment_id = max(max_comment_id, comment["id"])
+    return {"posts": db.query(func.max(PostArchive.id)).scalar() or 0, "comments": max_comment_id}
+
+def page_archived_comments(comments: list, limit: Optional[int] = None, after: Optional[str] = None) -> tuple:
+    """보관된 댓글 목록을 스레드 순서 페이지로 자름, (댓글 목록, 다음 페이지 시작 기준 path) 반환"""
+    if after:
+        comments = [comment for comment in comments if comment["path"] > after]
+    next_after = None
+    if limit is not None and len(comments) > limit:
+        comments = comments[:limit]
+        next_after = comments[-1]["path"]
+    return comments, next_after
+
+def delete_archived_post(db: Session, post_id: int, user_id: str) -> Optional[bool]:
+    """보관된 게시글 삭제 (커밋은 호출자가 수행), 없으면 None, 작성자가 아니면 False
+
+    사용자 활동 수는 보관할 때 이미 차감했으므로 다시 조정하지 않는다.
+    참조하던 업로드 파일은 고아 파일 정리에서 삭제된다.
+    """
+    archived = db.query(PostArchive.author_id).filter(PostArchive.id == post_id).first()
+    if not archived:
+        return None
+    if archived.author_id != user_id:
+        return False
+    db.query(ArchivedUpload).filter(ArchivedUpload.post_id == post_id).delete(synchronize_session=False)
+    db.query(PostArchive).filter(PostArchive.id == post_id).delete(synchronize_session=False)
+    return True
+
+def restore_post(db: Session, post_id: int) -> bool:
+    """보관된 게시글을 원래 테이블로 되돌림"""
+    archived = db.query(PostArchive).filter(PostArchive.id == post_id).first()
+    if not archived:
+        return False
+
+    payload = _decode(archived.data)
+    db.execute(Post.__table__.insert().values(
+        id=archived.id,
+        title=archived.title,
+        content=payload["content"],
+        excerpt=payload["excerpt"],
+        created_at=archived.created_at,
+        updated_at=archived.updated_at,
+        view_count=archived.view_count,
+        author_id=archived.author_id,
+        revision=archived.revision
+    ))
+
+    # path 순서로 넣으면 부모 댓글이 항상 먼저 들어감
+    comments = [{
+        **comment,
+        "post_id": post_id,
+        "created_at": _parse_time(comment["created_at"]),
+        "updated_at": _parse_time(comment["updated_at"])
+    } for comment in payload["comments"]]
+    if comments:
+        db.execute(Comment.__table__.insert(), comments)
+
+    revisions = [{**revision, "post_id": post_id, "created_at": _parse_time(revision["created_at"])} for revision in payload["revisions"]]
+    if revisions:
+        db.execute(PostRevision.__table__.insert(), revisions)
+
+    uploads = [{"post_id": post_id, "filename": row.filename} for row in db.query(ArchivedUpload.filename).filter(ArchivedUpload.post_id == post_id)]
+    if uploads:
+        db.execute(PostUpload.__table__.insert(), uploads)
+
+    adjust_user_counts(db, User.post_count, {archived.author_id: 1})
+    adjust_user_counts(db, User.comment_count, Counter(comment["author_id"] for comment in payload["comments"]))
+
+    db.query(ArchivedUpload).filter(ArchivedUpload.post_id == post_id).delete(synchronize_session=False)
+    db.query(PostArchive).filter(PostArchive.id == post_id).delete(synchronize_session=False)
+    db.commit()
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description="Move old posts and their comments into the archive tier")
+    parser.add_argument("--dry-run", action="store_true", help="list posts that would be archived")
+    parser.add_argument("--limit", type=int, default=None, help="maximum number of posts to archive")
+    parser.add_argument("--restore", type=int, metavar="POST_ID", help="move an archived post back to the hot tables")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        if args.restore is not None:
+            print(json.dumps({"restored": restore_post(db, args.restore)}))
+            return
+        report = run_archive_cycle(db, dry_run=args.dry_run, limit=args.limit)
+        print(json.dumps(report, indent=2))
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# utils/backfill.py
+import logging
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session
+from ..models import Post, Comment, User
+from .html_utils import make_excerpt
+from .comment_tree import child_path
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 200
+
+def _bulk_update(db: Session, table, values: dict, rows: list):
+    """id 기준 일괄 UPDATE (updated_at은 그대로 유지)"""
+    stmt = table.update().where(table.c.id == bindparam("_id")).values(
+        updated_at=table.c.updated_at, **{name: bindparam(name) for name in values}
+    )
+    db.execute(stmt, rows)
+    db.commit()
+
+def backfill_post_excerpts(db: Session) -> int:
+    """요약이 없는 기존 게시글의 excerpt 채우기, 처리한 게시글 수 반환"""
+    total = 0
+    last_id = 0
+    while True:
+        rows = db.query(Post.id, Post.content).filter(
+            Post.id > last_id, Post.excerpt.is_(None)
+        ).order_by(Post.id).limit(BACKFILL_BATCH_SIZE).all()
+        if not rows:
+            break
+
+        _bulk_update(db, Post.__table__, {"excerpt"}, [
+            {"_id": post_id, "excerpt": make_excerpt(content)} for post_id, content in rows
+        ])
+        total += len(rows)
+        last_id = rows[-1].id
+
+    if total:
+        logger.info(f"Backfilled excerpts for {total} posts")
+    return total
+
+def backfill_comment_paths(db: Session) -> int:
+    """스레드 도입 이전 댓글을 루트 댓글로 채우기, 처리한 댓글 수 반환"""
+    total = 0
+    while True:
+        ids = [row.id for row in db.query(Comment.id).filter(
+            Comment.path.is_(None)
+        ).order_by(Comment.id).limit(BACKFILL_BATCH_SIZE)]
+        if not ids:
+            break
+
+        _bulk_update(db, Comment.__table__, {"path", "depth", "reply_count"}, [
+            {"_id": comment_id, "path": child_path("", comment_id), "depth": 0, "reply_count": 0}
+            for comment_id in ids
+        ])
+        total += len(ids)
+
+    if total:
+        logger.info(f"Backfilled thread paths for {total} comments")
+    return total
+
+def backfill_user_counts(db: Session):
+    """사용자별 게시글/댓글 수를 실제 행 수로 다시 집계"""
+    post_count = select(func.count(Post.id)).where(Post.author_id == User.id).scalar_subquery()
+    comment_count = select(func.count(Comment.id)).where(Comment.author_id == User.id).scalar_subquery()
+    db.query(User).update(
+        {User.post_count: post_count, User.comment_count: comment_count}, synchronize_session=False
+    )
+    db.commit()
+    logger.info("Recounted user post/comment counts")
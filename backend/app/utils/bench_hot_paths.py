@@ -0,0 +1,162 @@
+# utils/bench_hot_paths.py
+"""
+조회 경로 DB 왕복 수/지연 시간 벤치마크
+
+이전 방식(문장 여러 개를 차례로 실행)과 hot_queries의 합친 문장을 같은 데이터로 비교한다.
+기본은 임시 SQLite 파일에 데이터를 채워 실행하고, --url로 빈 PostgreSQL 스키마를 지정할 수도 있다.
+
+    python -m app.utils.bench_hot_paths
+    python -m app.utils.bench_hot_paths --posts 20000 --iterations 500
+    python -m app.utils.bench_hot_paths --url "postgresql+psycopg://user:pw@localhost/bench"
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, event, func
+from sqlalchemy.orm import Session, sessionmaker, undefer
+from ..database import Base
+from ..models import Post, Comment, User
+from .comment_tree import child_path
+from .hot_queries import fetch_post_page, view_post, fetch_comments_with_post, fetch_comment_rows
+
+def _seed(db: Session, posts: int, comments_per_post: int):
+    db.add(User(id="bench", username="bench", password="x"))
+    now = datetime.now()
+    db.execute(Post.__table__.insert(), [{
+        "id": post_id,
+        "title": f"benchmark post {post_id}",
+        "content": "<p>" + "lorem ipsum " * 200 + "</p>",
+        "excerpt": "lorem ipsum",
+        "created_at": now - timedelta(minutes=post_id),
+        "view_count": 0,
+        "author_id": "bench",
+        "revision": 1
+    } for post_id in range(1, posts + 1)])
+    db.execute(Comment.__table__.insert(), [{
+        "post_id": post_id,
+        "content": "comment",
+        "created_at": now,
+        "author_id": "bench",
+        "path": child_path("", index),
+        "depth": 0,
+        "reply_count": 0
+    } for post_id in range(1, posts + 1) for index in range(1, comments_per_post + 1)])
+    db.commit()
+
+# 이전 방식: 게시글 목록 = 페이지 + 댓글 수 집계 + 전체 수
+def _list_before(db: Session, post_id: int):
+    posts = db.query(
+        Post.id, Post.title, Post.created_at, Post.updated_at, Post.view_count, Post.author_id
+    ).order_by(Post.created_at.desc()).offset(20).limit(10).all()
+    post_ids = [post.id for post in posts]
+    dict(db.query(Comment.post_id, func.count(Comment.id)).filter(Comment.post_id.in_(post_ids)).group_by(Comment.post_id).all())
+    db.query(func.count(Post.id)).scalar()
+
+def _list_after(db: Session, post_id: int):
+    fetch_post_page(db, 20, 10)
+
+# 이전 방식: 게시글 상세 = 조회 + 조회수 증가
+def _detail_before(db: Session, post_id: int):
+    db.query(Post).options(undefer(Post.content)).filter(Post.id == post_id).first()
+    db.query(Post).filter(Post.id == post_id).update(
+        {Post.view_count: Post.view_count + 1, Post.updated_at: Post.updated_at}, synchronize_session=False
+    )
+    db.commit()
+
+def _detail_after(db: Session, post_id: int):
+    view_post(db, post_id)
+
+# 이전 방식: 댓글 목록 = 게시글 존재 확인 + 댓글 조회
+def _comments_before(db: Session, post_id: int):
+    if db.query(Post.id).filter(Post.id == post_id).first():
+        db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.path).limit(51).all()
+
+def _comments_after(db: Session, post_id: int):
+    fetch_comments_with_post(db, post_id, 51)
+
+# 이전 방식: 상세 묶음 = 조회 + 댓글 + 조회수 증가
+def _bundle_before(db: Session, post_id: int):
+    db.query(Post).options(undefer(Post.content)).filter(Post.id == post_id).first()
+    db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.path).limit(51).all()
+    db.query(Post).filter(Post.id == post_id).update(
+        {Post.view_count: Post.view_count + 1, Post.updated_at: Post.updated_at}, synchronize_session=False
+    )
+    db.commit()
+
+def _bundle_after(db: Session, post_id: int):
+    view_post(db, post_id)
+    fetch_comment_rows(db, post_id, 51)
+
+CASES = [
+    ("GET /posts", _list_before, _list_after),
+    ("GET /posts/{id}", _detail_before, _detail_after),
+    ("GET /comments/post/{id}", _comments_before, _comments_after),
+    ("GET /posts/{id}/bundle", _bundle_before, _bundle_after)
+]
+
+def _measure(session_factory, engine, fn, posts: int, iterations: int) -> tuple:
+    """(요청당 문장 수, 평균 ms, p95 ms)"""
+    statements = []
+    counter = lambda *args: statements.append(1)
+    timings = []
+    db = session_factory()
+    try:
+        for index in range(iterations + 20):
+            if index == 20:
+                # 앞의 20회는 캐시 준비용
+                event.listen(engine, "before_cursor_execute", counter)
+                timings.clear()
+            post_id = index % posts + 1
+            started = time.perf_counter()
+            fn(db, post_id)
+            db.rollback()  # 조회만 한 경우 트랜잭션 종료 (요청 종료 시 세션 close와 동일)
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", counter)
+        db.close()
+    timings.sort()
+    return len(statements) / iterations, statistics.mean(timings), timings[int(len(timings) * 0.95) - 1]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare DB round trips and latency of hot read paths")
+    parser.add_argument("--url", default=None, help="database URL (default: temporary SQLite file)")
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--comments", type=int, default=20, help="comments per post")
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    directory = None
+    url = args.url
+    if url is None:
+        directory = tempfile.mkdtemp()
+        url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+
+    engine = create_engine(url)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    try:
+        Base.metadata.create_all(bind=engine)
+        with session_factory() as db:
+            _seed(db, args.posts, args.comments)
+
+        print(f"{url.split('://')[0]}: {args.posts} posts x {args.comments} comments, {args.iterations} iterations")
+        print(f"{'path':<26}{'stmts before':>13}{'stmts after':>12}{'mean before':>13}{'mean after':>12}{'p95 before':>12}{'p95 after':>11}")
+        for name, before, after in CASES:
+            before_stats = _measure(session_factory, engine, before, args.posts, args.iterations)
+            after_stats = _measure(session_factory, engine, after, args.posts, args.iterations)
+            print(
+                f"{name:<26}{before_stats[0]:>13.1f}{after_stats[0]:>12.1f}"
+                f"{before_stats[1]:>11.3f}ms{after_stats[1]:>10.3f}ms{before_stats[2]:>10.3f}ms{after_stats[2]:>9.3f}ms"
+            )
+    finally:
+        engine.dispose()
+        if directory:
+            for name in os.listdir(directory):
+                os.remove(os.path.join(directory, name))
+            os.rmdir(directory)
+
+if __name__ == "__main__":
+    main()
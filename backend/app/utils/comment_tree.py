@@ -0,0 +1,27 @@
+# utils/comment_tree.py
+"""
+댓글 트리 materialized path
+
+각 댓글의 path는 루트부터 자신까지의 ID를 고정 길이 36진수로 이어 붙인 문자열이다.
+path 순으로 정렬하면 스레드가 작성 순서대로 펼쳐지고(전위 순회),
+서브트리는 [path, path + "~") 범위 하나로 조회된다.
+"""
+
+SEGMENT_LENGTH = 8  # 36^8 ≈ 2.8조 개 ID까지
+SUBTREE_UPPER = "~"  # 세그먼트 문자(0-9a-z)보다 큰 문자
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+def encode_segment(comment_id: int) -> str:
+    """댓글 ID를 고정 길이 36진수 세그먼트로 변환"""
+    chars = []
+    while comment_id:
+        comment_id, rem = divmod(comment_id, 36)
+        chars.append(DIGITS[rem])
+    return "".join(reversed(chars)).rjust(SEGMENT_LENGTH, "0")
+
+def child_path(parent_path: str, comment_id: int) -> str:
+    return (parent_path or "") + encode_segment(comment_id)
+
+def subtree_upper_bound(path):
+    """서브트리 범위 조회용 상한 (path >= p AND path < 상한), 컬럼 표현식에도 사용 가능"""
+    return path + SUBTREE_UPPER
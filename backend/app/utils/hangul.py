@@ -0,0 +1,62 @@
+# utils/hangul.py
+import re
+import unicodedata
+
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_COUNT = 11172
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"
+]
+JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
+]
+# 단독으로 입력된 겹자모 (입력 중인 글자)
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"
+}
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def normalize_text(text: str) -> str:
+    """NFC 정규화, 소문자, 공백 정리"""
+    return WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFC", text).lower()).strip()
+
+def decompose(text: str) -> str:
+    """한글 음절을 기본 자모로 분해 ("닭" -> "ㄷㅏㄹㄱ")
+
+    겹받침과 이중 모음까지 나누므로 입력 중인 글자("달", "가")도 완성된 제목의 앞부분과 일치한다.
+    """
+    parts = []
+    for char in text:
+        offset = ord(char) - SYLLABLE_BASE
+        if 0 <= offset < SYLLABLE_COUNT:
+            parts.append(CHOSEONG[offset // (JUNGSEONG_COUNT * JONGSEONG_COUNT)])
+            parts.append(JUNGSEONG[offset // JONGSEONG_COUNT % JUNGSEONG_COUNT])
+            parts.append(JONGSEONG[offset % JONGSEONG_COUNT])
+        else:
+            parts.append(COMPOUND_JAMO.get(char, char))
+    return "".join(parts)
+
+def choseong(text: str) -> str:
+    """초성만 추출 ("안녕하세요" -> "ㅇㄴㅎㅅㅇ"), 한글이 아닌 글자는 그대로, 공백은 제거"""
+    parts = []
+    for char in text:
+        offset = ord(char) - SYLLABLE_BASE
+        if 0 <= offset < SYLLABLE_COUNT:
+            parts.append(CHOSEONG[offset // (JUNGSEONG_COUNT * JONGSEONG_COUNT)])
+        elif not char.isspace():
+            parts.append(char)
+    return "".join(parts)
+
+def is_choseong_query(text: str) -> bool:
+    """초성(자음)만으로 이루어진 검색어 여부"""
+    letters = [char for char in text if not char.isspace()]
+    return bool(letters) and all(char in CHOSEONG for char in letters)
@@ -0,0 +1,96 @@
+# utils/hot_queries.py
+"""
+자주 호출되는 조회 경로의 고정 형태 쿼리
+
+문장을 모듈 로드 시 한 번만 만들고 값은 bindparam으로 넘기므로 요청마다 쿼리 객체를
+다시 구성하지 않고 SQLAlchemy 컴파일 캐시를 그대로 재사용한다.
+드라이버 쪽 준비된 문장 캐시는 database.py의 연결 설정을 참고.
+여러 문장을 하나로 합쳐 요청당 DB 왕복 수를 줄인다.
+
+- 게시글 목록: 페이지 + 댓글 수(상관 서브쿼리) + 전체 수(스칼라 서브쿼리)를 한 번에
+- 게시글 상세: 조회수 증가와 본문 조회를 UPDATE ... RETURNING 한 번에
+- 댓글 목록: 게시글 존재 확인과 댓글 조회를 LEFT JOIN 한 번에
+"""
+
+from typing import Optional, Tuple
+from sqlalchemy import and_, bindparam, func, select, update
+from sqlalchemy.orm import Session
+from ..models import Post, Comment
+
+_comment_count = select(func.count(Comment.id)).where(Comment.post_id == Post.id).correlate(Post).scalar_subquery()
+
+POST_PAGE = select(
+    Post.id, Post.title, Post.created_at, Post.updated_at, Post.view_count, Post.author_id,
+    _comment_count.label("comment_count"),
+    select(func.count(Post.id)).scalar_subquery().label("total")  # 비상관 서브쿼리라 한 번만 계산
+).order_by(Post.created_at.desc()).offset(bindparam("offset")).limit(bindparam("limit"))
+
+POST_COUNT = select(func.count(Post.id))
+
+POST_DETAIL_COLUMNS = (
+    Post.id, Post.title, Post.content, Post.created_at, Post.updated_at,
+    Post.view_count, Post.revision, Post.author_id
+)
+
+VIEW_POST = update(Post).where(Post.id == bindparam("post_id")).values(
+    view_count=func.coalesce(Post.view_count, 0) + 1,
+    updated_at=Post.updated_at  # 수정 시각 유지
+).returning(*POST_DETAIL_COLUMNS).execution_options(synchronize_session=False)
+
+SELECT_POST = select(*POST_DETAIL_COLUMNS).where(Post.id == bindparam("post_id"))
+
+INCREMENT_VIEW = update(Post).where(Post.id == bindparam("post_id")).values(
+    view_count=func.coalesce(Post.view_count, 0) + 1,
+    updated_at=Post.updated_at
+).execution_options(synchronize_session=False)
+
+# 게시글 행 하나에 댓글을 LEFT JOIN (댓글이 없어도 게시글이 있으면 NULL 댓글 행 하나)
+_post_with_comments = select(Post.id, Comment).outerjoin(
+    Comment, and_(Comment.post_id == Post.id, Comment.path > bindparam("after"))
+).where(Post.id == bindparam("post_id")).order_by(Comment.path)
+
+COMMENTS_WITH_POST = _post_with_comments
+COMMENTS_WITH_POST_PAGE = _post_with_comments.limit(bindparam("limit"))
+
+COMMENTS = select(Comment).where(
+    Comment.post_id == bindparam("post_id"), Comment.path > bindparam("after")
+).order_by(Comment.path)
+COMMENT_PAGE = COMMENTS.limit(bindparam("limit"))
+
+def fetch_post_page(db: Session, offset: int, limit: int) -> Tuple[list, int]:
+    """게시글 목록 한 페이지와 전체 게시글 수 (보통 1회 왕복)"""
+    rows = db.execute(POST_PAGE, {"offset": offset, "limit": limit}).all()
+    if rows:
+        return rows, rows[0].total
+    # 마지막 페이지를 넘으면 결과 행이 없으므로 따로 집계
+    return rows, db.execute(POST_COUNT).scalar()
+
+def view_post(db: Session, post_id: int):
+    """조회수를 증가시키고 증가 후 게시글 행 반환 (없으면 None, 커밋 포함)"""
+    if db.get_bind().dialect.update_returning:
+        row = db.execute(VIEW_POST, {"post_id": post_id}).first()
+    else:
+        # RETURNING 미지원 DB는 같은 트랜잭션에서 증가 후 조회
+        db.execute(INCREMENT_VIEW, {"post_id": post_id})
+        row = db.execute(SELECT_POST, {"post_id": post_id}).first()
+    db.commit()
+    return row
+
+def fetch_comments_with_post(db: Session, post_id: int, limit: Optional[int] = None,
+                             after: Optional[str] = None) -> Optional[list]:
+    """게시글이 있으면 스레드 순서 댓글 목록, 없으면 None (1회 왕복)"""
+    params = {"post_id": post_id, "after": after or ""}
+    if limit is None:
+        rows = db.execute(COMMENTS_WITH_POST, params).all()
+    else:
+        rows = db.execute(COMMENTS_WITH_POST_PAGE, {**params, "limit": limit}).all()
+    if not rows:
+        return None
+    return [comment for _, comment in rows if comment is not None]
+
+def fetch_comment_rows(db: Session, post_id: int, limit: Optional[int] = None, after: Optional[str] = None) -> list:
+    """게시글 존재가 확인된 경우의 댓글 목록 (after 이후 limit개)"""
+    params = {"post_id": post_id, "after": after or ""}
+    if limit is None:
+        return db.execute(COMMENTS, params).scalars().all()
+    return db.execute(COMMENT_PAGE, {**params, "limit": limit}).scalars().all()
@@ -0,0 +1,54 @@
+# utils/html_utils.py
+import re
+from html.parser import HTMLParser
+from ..config import settings
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+class _TextExtractor(HTMLParser):
+    """HTML에서 보이는 텍스트만 수집"""
+
+    SKIP_TAGS = {"script", "style"}
+    BLOCK_TAGS = {"p", "div", "br", "li", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "tr"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append(" ")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+def html_to_text(html: str) -> str:
+    """Tiptap HTML을 공백 정리된 일반 텍스트로 변환"""
+    if not html:
+        return ""
+    parser = _TextExtractor()
+    parser.feed(html)
+    parser.close()
+    return WHITESPACE_PATTERN.sub(" ", "".join(parser.parts)).strip()
+
+def make_excerpt(html: str, length: int = None) -> str:
+    """목록/검색용 본문 요약 생성 (단어 경계에서 자름)"""
+    length = length or settings.EXCERPT_LENGTH
+    text = html_to_text(html)
+    if len(text) <= length:
+        return text
+    cut = text[:length]
+    space = cut.rfind(" ")
+    if space > length // 2:
+        cut = cut[:space]
+    return cut.rstrip() + "..."
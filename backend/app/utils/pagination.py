@@ -0,0 +1,21 @@
+# utils/pagination.py
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(작성 시각, ID) 키셋 커서를 불투명 문자열로 변환"""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """커서 문자열 해석 (없으면 None, 잘못된 값이면 400)"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
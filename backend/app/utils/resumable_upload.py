@@ -0,0 +1,198 @@
+# utils/resumable_upload.py
+"""
+이어받기(tus 방식) 업로드 세션 저장소
+
+세션마다 UPLOAD_DIR/.partial 아래에 메타데이터(JSON)와 받은 만큼의 데이터(.part)를 둔다.
+현재 오프셋은 .part 파일 크기이며, 마지막 청크를 받으면 같은 파일시스템 안에서
+os.replace로 업로드 디렉터리에 옮기므로 데이터를 다시 복사하지 않는다.
+완료된 세션은 메타데이터에 결과를 기록해 RESUMABLE_EXPIRY 동안 남겨 두므로
+마지막 응답을 받지 못한 클라이언트도 HEAD/GET으로 완료 여부와 결과를 확인할 수 있다.
+"""
+
+import base64
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException
+from ..config import settings
+from .file_utils import get_file_type
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_DIR = ".partial"  # 점으로 시작하므로 고아 파일 정리 대상에서 제외
+CHECKSUM_ALGORITHMS = {"sha256", "sha1", "md5"}
+
+def _partial_dir() -> str:
+    path = os.path.join(settings.UPLOAD_DIR, PARTIAL_DIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def _paths(upload_id: str) -> tuple:
+    # upload_id는 경로에 쓰이므로 uuid 형식만 허용
+    try:
+        upload_id = str(uuid.UUID(upload_id))
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    base = os.path.join(_partial_dir(), upload_id)
+    return base + ".json", base + ".part"
+
+def create_session(owner: str, filename: str, size: int, mime_type: Optional[str]) -> dict:
+    """업로드 세션 생성 (빈 .part 파일과 메타데이터 기록)"""
+    if size <= 0 or size > settings.RESUMABLE_MAX_FILE_SIZE:
+        raise HTTPException(status_code=413, detail="File too large")
+    
+    upload_id = str(uuid.uuid4())
+    meta_path, part_path = _paths(upload_id)
+    meta = {
+        "upload_id": upload_id,
+        "owner": owner,
+        "filename": filename,
+        "size": size,
+        "mime_type": mime_type or "application/octet-stream",
+        "created_at": datetime.now().isoformat()
+    }
+    open(part_path, "wb").close()
+    _write_meta(meta_path, meta)
+    return {**meta, "offset": 0}
+
+def _write_meta(meta_path: str, meta: dict):
+    # 읽는 쪽이 쓰다 만 JSON을 보지 않도록 임시 파일에 쓰고 교체
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+def load_session(upload_id: str, owner: str) -> dict:
+    """세션 메타데이터와 현재 오프셋 (없거나 다른 사용자 세션이면 404)"""
+    meta_path, part_path = _paths(upload_id)
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+        # 완료된 세션은 .part 파일이 업로드 디렉터리로 옮겨졌으므로 전체 크기가 오프셋
+        offset = meta["size"] if "result" in meta else os.path.getsize(part_path)
+    except (FileNotFoundError, json.JSONDecodeError):
+        raise HTTPException(status_code=404, detail="Upload not found")
+    if meta["owner"] != owner:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return {**meta, "offset": offset}
+
+def verify_checksum(data: bytes, header: Optional[str]):
+    """Upload-Checksum 헤더("<알고리즘> <base64 digest>") 검증"""
+    if not header:
+        return
+    algorithm, _, encoded = header.strip().partition(" ")
+    algorithm = algorithm.lower()
+    if algorithm not in CHECKSUM_ALGORITHMS:
+        raise HTTPException(status_code=400, detail="Unsupported checksum algorithm")
+    try:
+        expected = base64.b64decode(encoded.strip(), validate=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid checksum")
+    if hashlib.new(algorithm, data).digest() != expected:
+        # tus 체크섬 확장의 Checksum Mismatch 상태 코드
+        raise HTTPException(status_code=460, detail="Checksum mismatch")
+
+def write_chunk(upload_id: str, owner: str, offset: int, data: bytes) -> dict:
+    """오프셋 위치에 청크 기록, 마지막 청크면 파일 완성 (동기 I/O - 스레드풀에서 호출)"""
+    session = load_session(upload_id, owner)
+    if "result" in session:
+        return session  # 이미 완료됨 (마지막 응답을 받지 못한 클라이언트의 재전송)
+    meta_path, part_path = _paths(upload_id)
+    
+    try:
+        fd = os.open(part_path, os.O_WRONLY)
+    except FileNotFoundError:
+        # 다른 요청이 방금 완료했거나 취소함
+        return load_session(upload_id, owner)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise HTTPException(status_code=409, detail="Upload is busy")
+        
+        # 잠금 후 실제 오프셋 재확인 (같은 청크 재전송 / 순서 어긋남 방지)
+        current = os.fstat(fd).st_size
+        if offset != current:
+            raise HTTPException(status_code=409, detail=f"Offset mismatch (current: {current})")
+        if current + len(data) > session["size"]:
+            raise HTTPException(status_code=413, detail="Chunk exceeds declared size")
+        
+        os.lseek(fd, current, os.SEEK_SET)
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+        session["offset"] = current + len(data)
+        
+        if session["offset"] == session["size"]:
+            _finalize(session, meta_path, part_path)
+    finally:
+        os.close(fd)
+    return session
+
+def _finalize(session: dict, meta_path: str, part_path: str):
+    """완성된 .part 파일을 업로드 디렉터리로 이동 (복사 없이 이름만 변경)하고 결과를 세션에 기록"""
+    filename = session["filename"]
+    file_ext = filename.split('.')[-1] if '.' in filename else ''
+    unique_filename = f"{uuid.uuid4()}.{file_ext}" if file_ext else str(uuid.uuid4())
+    session["result"] = {
+        "url": f"/uploads/{unique_filename}",
+        "filename": filename,
+        "size": session["size"],
+        "type": get_file_type(filename),
+        "mime_type": session["mime_type"]
+    }
+    session["completed_at"] = datetime.now().isoformat()
+    os.replace(part_path, os.path.join(settings.UPLOAD_DIR, unique_filename))
+    # 완료 기록은 만료 시각까지 남겨 둠 (만료 정리는 .json 수정 시각 기준)
+    _write_meta(meta_path, {key: value for key, value in session.items() if key != "offset"})
+    
+    logger.info(f"Resumable upload completed: {session['upload_id']} -> {unique_filename}")
+
+def delete_session(upload_id: str, owner: str):
+    """업로드 취소 (완료된 세션이면 기록만 삭제)"""
+    load_session(upload_id, owner)
+    for path in _paths(upload_id):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def purge_expired_sessions(dry_run: bool = False) -> int:
+    """마지막 청크 이후 RESUMABLE_EXPIRY가 지난 세션(완료 기록 포함) 삭제, 삭제한 세션 수 반환"""
+    cutoff = time.time() - settings.RESUMABLE_EXPIRY
+    partial_dir = _partial_dir()
+    
+    # 세션별 마지막 활동 시각 (.part 파일은 청크를 받을 때마다, 완료된 세션의 .json은 완료 시 갱신됨)
+    last_active = {}
+    with os.scandir(partial_dir) as entries:
+        for entry in entries:
+            stem, _, ext = entry.name.partition(".")
+            if ext not in ("json", "part", "json.tmp"):
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            last_active[stem] = max(last_active.get(stem, 0.0), mtime)
+    
+    purged = 0
+    for stem, mtime in last_active.items():
+        if mtime >= cutoff:
+            continue
+        purged += 1
+        if dry_run:
+            continue
+        for ext in (".json", ".part", ".json.tmp"):
+            try:
+                os.remove(os.path.join(partial_dir, stem + ext))
+            except FileNotFoundError:
+                pass
+    return purged
@@ -0,0 +1,93 @@
+# utils/revisions.py
+"""
+게시글 리비전 변경분 저장
+
+변경 연산은 [start, end, text] 목록으로, 기준 본문의 start:end 구간을 text로 바꾼다.
+위치는 기준 본문의 문자(코드 포인트) 단위이며 겹치지 않게 오름차순이어야 한다.
+수정되지 않은 글은 이력을 저장하지 않고, 첫 수정 때 수정 전 본문을 기준 스냅샷으로 남긴다.
+이후 SNAPSHOT_INTERVAL의 배수 리비전마다 전체 본문을 저장하므로 어떤 리비전이든
+가장 가까운 스냅샷에서 최대 SNAPSHOT_INTERVAL - 1개의 변경분만 적용하면 복원된다.
+"""
+
+import json
+from typing import Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import exists, func
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..models import PostRevision
+
+def diff_ops(old: str, new: str) -> list:
+    """공통 앞/뒤 부분을 제외한 단일 치환 연산 (O(n))"""
+    if old == new:
+        return []
+    limit = min(len(old), len(new))
+    start = 0
+    while start < limit and old[start] == new[start]:
+        start += 1
+    end_old, end_new = len(old), len(new)
+    while end_old > start and end_new > start and old[end_old - 1] == new[end_new - 1]:
+        end_old -= 1
+        end_new -= 1
+    return [[start, end_old, new[start:end_new]]]
+
+def apply_ops(base: str, ops: list) -> str:
+    """변경 연산 적용 (잘못된 연산이면 400)"""
+    parts = []
+    cursor = 0
+    for op in ops:
+        if len(op) != 3:
+            raise HTTPException(status_code=400, detail="Invalid patch operation")
+        start, end, text = op
+        if not (isinstance(start, int) and isinstance(end, int) and isinstance(text, str)):
+            raise HTTPException(status_code=400, detail="Invalid patch operation")
+        if start < cursor or end < start or end > len(base):
+            raise HTTPException(status_code=400, detail="Patch operations out of range or overlapping")
+        parts.append(base[cursor:start])
+        parts.append(text)
+        cursor = end
+    parts.append(base[cursor:])
+    return "".join(parts)
+
+def is_snapshot_revision(revision: int) -> bool:
+    return revision % settings.REVISION_SNAPSHOT_INTERVAL == 0
+
+def ensure_base_revision(db: Session, post_id: int, revision: int, title: str, content: str):
+    """첫 수정이면 수정 전 본문을 기준 스냅샷으로 저장 (이미 이력이 있으면 아무것도 하지 않음)"""
+    if revision > 1:
+        return  # 리비전 2 이상이면 이전 수정에서 기준 스냅샷이 저장됨
+    has_history = db.query(exists().where(PostRevision.post_id == post_id)).scalar()
+    if not has_history:
+        record_revision(db, post_id, revision, title, content)
+
+def record_revision(db: Session, post_id: int, revision: int, title: str, content: str,
+                    previous_content: Optional[str] = None, ops: Optional[list] = None):
+    """리비전 저장 (스냅샷 주기가 아니면 직전 본문 대비 변경분만)"""
+    if is_snapshot_revision(revision) or previous_content is None:
+        data, snapshot = content, True
+    else:
+        data = json.dumps(ops if ops is not None else diff_ops(previous_content, content), ensure_ascii=False, separators=(",", ":"))
+        snapshot = False
+    db.add(PostRevision(post_id=post_id, revision=revision, title=title, is_snapshot=snapshot, data=data))
+
+def load_revision(db: Session, post_id: int, revision: int) -> Optional[Tuple[str, str]]:
+    """리비전의 (제목, 본문) 복원, 없으면 None"""
+    # 가장 가까운 이전 스냅샷부터 요청 리비전까지 한 번에 조회
+    snapshot_rev = db.query(func.max(PostRevision.revision)).filter(
+        PostRevision.post_id == post_id,
+        PostRevision.revision <= revision,
+        PostRevision.is_snapshot.is_(True)
+    ).scalar_subquery()
+    chain = db.query(PostRevision).filter(
+        PostRevision.post_id == post_id,
+        PostRevision.revision >= snapshot_rev,
+        PostRevision.revision <= revision
+    ).order_by(PostRevision.revision).all()
+
+    if not chain or chain[-1].revision != revision or not chain[0].is_snapshot:
+        return None
+
+    content = chain[0].data
+    for row in chain[1:]:
+        content = apply_ops(content, json.loads(row.data))
+    return chain[-1].title, content
@@ -0,0 +1,175 @@
+# utils/upload_gc.py
+"""
+고아 업로드 파일 정리
+
+게시글이 참조하지 않는 업로드 파일을 유예 기간이 지난 뒤 삭제한다.
+한 번에 일부 파일만 검사하고(커서 유지), 삭제 속도를 제한한다.
+
+    python -m app.utils.upload_gc --dry-run
+    python -m app.utils.upload_gc --reindex
+"""
+
+import argparse
+import bisect
+import fcntl
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Optional
+from ..config import settings
+from ..database import SessionLocal
+from ..models import PostUpload, ArchivedUpload
+from .resumable_upload import purge_expired_sessions
+
+logger = logging.getLogger(__name__)
+
+LOCK_FILE = ".gc.lock"
+
+class UploadSweeper:
+    """업로드 디렉터리를 점진적으로 검사하여 참조되지 않는 파일 삭제"""
+
+    def __init__(self, upload_dir: Optional[str] = None):
+        self.upload_dir = upload_dir or settings.UPLOAD_DIR
+        self.cursor = ""  # 마지막으로 검사한 파일명
+        self.stats = {
+            "runs": 0,
+            "files_scanned": 0,
+            "files_deleted": 0,
+            "bytes_reclaimed": 0,
+            "expired_uploads": 0,
+            "last_run_at": None,
+        }
+
+    def run_cycle(self, dry_run: bool = False, scan_limit: Optional[int] = None) -> dict:
+        """한 주기 검사 실행 후 보고서 반환 (다른 워커가 실행 중이면 건너뜀)"""
+        report = {"dry_run": dry_run, "skipped": False, "scanned": 0, "orphans": [], "bytes_reclaimed": 0, "expired_uploads": 0}
+
+        lock_fd = self._acquire_lock()
+        if lock_fd is None:
+            report["skipped"] = True
+            return report
+
+        try:
+            # 방치된 이어받기 업로드 세션 정리
+            report["expired_uploads"] = purge_expired_sessions(dry_run)
+
+            names = self._candidate_names(scan_limit or settings.UPLOAD_GC_SCAN_LIMIT)
+            batch_size = settings.UPLOAD_GC_BATCH_SIZE
+            for start in range(0, len(names), batch_size):
+                self._sweep_batch(names[start:start + batch_size], dry_run, report)
+        finally:
+            os.close(lock_fd)
+
+        if not dry_run:
+            self.stats["runs"] += 1
+            self.stats["files_scanned"] += report["scanned"]
+            self.stats["files_deleted"] += len(report["orphans"])
+            self.stats["bytes_reclaimed"] += report["bytes_reclaimed"]
+            self.stats["expired_uploads"] += report["expired_uploads"]
+            self.stats["last_run_at"] = datetime.now().isoformat()
+        return report
+
+    def _acquire_lock(self) -> Optional[int]:
+        os.makedirs(self.upload_dir, exist_ok=True)
+        fd = os.open(os.path.join(self.upload_dir, LOCK_FILE), os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        return fd
+
+    def _candidate_names(self, limit: int) -> list:
+        """커서 이후 파일명 최대 limit개 (끝에 도달하면 처음부터 다시)"""
+        with os.scandir(self.upload_dir) as entries:
+            names = sorted(
+                entry.name for entry in entries
+                if not entry.name.startswith(".") and entry.is_file(follow_symlinks=False)
+            )
+
+        start = bisect.bisect_right(names, self.cursor)
+        selected = names[start:start + limit]
+        if len(selected) < limit:
+            # 한 바퀴 돌았으면 처음부터
+            selected += names[:min(start, limit - len(selected))]
+            self.cursor = selected[-1] if selected and len(names) > limit else ""
+        else:
+            self.cursor = selected[-1]
+        return selected
+
+    def _sweep_batch(self, names: list, dry_run: bool, report: dict):
+        cutoff = time.time() - settings.UPLOAD_GC_GRACE_PERIOD
+        aged = {}
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.upload_dir, name))
+            except FileNotFoundError:
+                continue
+            report["scanned"] += 1
+            if stat.st_mtime < cutoff:
+                aged[name] = stat.st_size
+        if not aged:
+            return
+
+        db = SessionLocal()
+        try:
+            referenced = {
+                row.filename for row in
+                db.query(PostUpload.filename).filter(PostUpload.filename.in_(list(aged))).distinct()
+            }
+            # 보관된 게시글이 참조하는 파일도 유지
+            referenced.update(
+                row.filename for row in
+                db.query(ArchivedUpload.filename).filter(ArchivedUpload.filename.in_(list(aged))).distinct()
+            )
+        finally:
+            db.close()
+
+        delay = 1.0 / settings.UPLOAD_GC_MAX_DELETES_PER_SEC
+        for name, size in aged.items():
+            if name in referenced:
+                continue
+            if not dry_run:
+                try:
+                    os.remove(os.path.join(self.upload_dir, name))
+                except FileNotFoundError:
+                    continue
+                time.sleep(delay)  # 디스크 I/O 속도 제한
+            report["orphans"].append({"filename": name, "size": size})
+            report["bytes_reclaimed"] += size
+
+sweeper = UploadSweeper()
+
+def run_sweep_cycle() -> dict:
+    """백그라운드 작업용 1회 실행 (결과 로깅)"""
+    report = sweeper.run_cycle()
+    if not report["skipped"]:
+        logger.info(
+            f"Upload GC: scanned {report['scanned']}, deleted {len(report['orphans'])}, "
+            f"reclaimed {report['bytes_reclaimed']} bytes, expired {report['expired_uploads']} partial uploads"
+        )
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove uploaded files no longer referenced by any post")
+    parser.add_argument("--dry-run", action="store_true", help="report orphans without deleting them")
+    parser.add_argument("--reindex", action="store_true", help="rebuild the post/upload reference index first")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.reindex:
+        from .upload_refs import reindex_post_uploads
+        db = SessionLocal()
+        try:
+            reindex_post_uploads(db)
+        finally:
+            db.close()
+
+    # 전체 디렉터리를 한 번에 검사
+    report = sweeper.run_cycle(dry_run=args.dry_run, scan_limit=10 ** 9)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+if __name__ == "__main__":
+    main()
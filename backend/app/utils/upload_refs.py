@@ -0,0 +1,60 @@
+# utils/upload_refs.py
+import re
+import logging
+from typing import Set
+from sqlalchemy.orm import Session
+from ..models import Post, PostUpload, PostRevision
+
+logger = logging.getLogger(__name__)
+
+# 본문 HTML 속 "/uploads/<파일명>" 참조 (절대 URL 포함)
+UPLOAD_URL_PATTERN = re.compile(r"/uploads/([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+REINDEX_BATCH_SIZE = 500
+
+def extract_upload_refs(content: str) -> Set[str]:
+    """게시글 본문에서 참조하는 업로드 파일명 추출"""
+    if not content:
+        return set()
+    return set(UPLOAD_URL_PATTERN.findall(content))
+
+def sync_post_uploads(post: Post):
+    """게시글 본문이 새로 참조하는 업로드 추가 (커밋 전에 호출)
+
+    수정 이력의 이전 리비전도 같은 파일을 참조하므로 본문에서 빠진 참조는 지우지 않는다.
+    게시글이 삭제되면 참조도 함께 삭제되어 정리 대상이 된다.
+    """
+    current = {ref.filename for ref in post.uploads}
+    for filename in extract_upload_refs(post.content) - current:
+        post.uploads.append(PostUpload(filename=filename))
+
+def reindex_post_uploads(db: Session) -> int:
+    """기존 게시글 전체의 업로드 참조 재구성 (수정 이력 포함), 참조 수 반환"""
+    db.query(PostUpload).delete(synchronize_session=False)
+
+    total = 0
+    last_id = 0
+    while True:
+        rows = db.query(Post.id, Post.content).filter(Post.id > last_id).order_by(Post.id).limit(REINDEX_BATCH_SIZE).all()
+        if not rows:
+            break
+
+        wanted = {post_id: extract_upload_refs(content) for post_id, content in rows}
+        # 스냅샷은 본문 전체, 변경분은 삽입된 텍스트를 담고 있으므로 그대로 검색
+        revisions = db.query(PostRevision.post_id, PostRevision.data).filter(PostRevision.post_id.in_(list(wanted)))
+        for post_id, data in revisions:
+            wanted[post_id] |= extract_upload_refs(data)
+
+        refs = [
+            {"post_id": post_id, "filename": filename}
+            for post_id, filenames in wanted.items()
+            for filename in filenames
+        ]
+        if refs:
+            db.bulk_insert_mappings(PostUpload, refs)
+        total += len(refs)
+        last_id = rows[-1].id
+
+    db.commit()
+    logger.info(f"Upload reference index rebuilt: {total} references")
+    return total
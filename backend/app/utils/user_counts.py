@@ -0,0 +1,16 @@
+# utils/user_counts.py
+from sqlalchemy.orm import Session
+from ..models import User
+
+def adjust_user_counts(db: Session, column, deltas: dict):
+    """사용자별 활동 수 원자적 증감 (커밋 전에 호출)
+
+    column: User.post_count 또는 User.comment_count
+    deltas: {user_id: 증감값}
+    """
+    for user_id, delta in deltas.items():
+        if user_id is None or not delta:
+            continue
+        db.query(User).filter(User.id == user_id).update(
+            {column: column + delta}, synchronize_session=False
+        )
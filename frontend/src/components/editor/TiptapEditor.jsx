@@ -11,7 +11,7 @@ import {
   Quote, Undo, Redo, Image as ImageIcon, Link as LinkIcon,
   Upload, Heading1, Heading2, FileText, AlertCircle
 } from 'lucide-react';
-import { fileManager, formatFileSize } from '../../utils/fileManager';
+import { fileManager, formatFileSize, MAX_RESUMABLE_FILE_SIZE } from '../../utils/fileManager';
 
 // 툴바 버튼 컴포넌트
 const ToolbarButton = ({ onClick, isActive, disabled, children, title }) => (
@@ -167,9 +167,9 @@ const TiptapEditor = ({
       const files = Array.from(e.target.files);
       
       for (const file of files) {
-        // 파일 크기 체크 (10MB 제한)
-        if (file.size > 10 * 1024 * 1024) {
-          alert(`파일이 너무 큽니다: ${file.name} (최대 10MB)`);
+        // 파일 크기 체크 (큰 파일은 이어받기 업로드로 최대 2GB)
+        if (file.size > MAX_RESUMABLE_FILE_SIZE) {
+          alert(`파일이 너무 큽니다: ${file.name} (최대 2GB)`);
           continue;
         }
         
@@ -244,9 +244,10 @@ const TiptapEditor = ({
     const files = Array.from(event.dataTransfer.files);
     
     for (const file of files) {
-      // 파일 크기 체크
-      if (file.size > 10 * 1024 * 1024) {
-        alert(`파일이 너무 큽니다: ${file.name} (최대 10MB)`);
+      // 파일 크기 체크 (이미지는 10MB, 그 외는 이어받기 업로드로 최대 2GB)
+      const maxSize = file.type.startsWith('image/') ? 10 * 1024 * 1024 : MAX_RESUMABLE_FILE_SIZE;
+      if (file.size > maxSize) {
+        alert(`파일이 너무 큽니다: ${file.name} (최대 ${formatFileSize(maxSize)})`);
         continue;
       }
       
@@ -1,7 +1,7 @@
 // components/post/CommentSection.jsx
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { MessageCircle, Trash2, Send, User, Calendar } from 'lucide-react';
-import { commentAPI } from '../../services/api';
+import { commentAPI, eventsAPI } from '../../services/api';
 import { formatRelativeTime, formatFullDateTime } from '../../utils/dateUtils';
 
 // 댓글 아이템 컴포넌트
@@ -23,7 +23,10 @@ const CommentItem = ({ comment, onDelete, currentUser }) => {
   };
 
   return (
-    <div className="border-b border-gray-200 py-4 last:border-b-0">
+    <div
+      className="border-b border-gray-200 py-4 last:border-b-0"
+      style={{ marginLeft: `${(comment.depth || 0) * 1.5}rem` }}
+    >
       <div className="flex justify-between items-start mb-2">
         <div className="flex items-center space-x-3">
           <div className="flex items-center space-x-2 text-sm">
@@ -113,16 +116,68 @@ const CommentForm = ({ onSubmit, currentUser }) => {
   );
 };
 
+// 스레드 순서(path 오름차순)를 유지하며 댓글 삽입 (답글은 부모 스레드 중간에 들어감)
+const insertByPath = (comments, comment) => {
+  if (comments.some(c => c.id === comment.id)) {
+    return comments;
+  }
+  const index = comments.findIndex(c => c.path > comment.path);
+  if (index === -1) {
+    return [...comments, comment];
+  }
+  return [...comments.slice(0, index), comment, ...comments.slice(index)];
+};
+
 // 메인 댓글 섹션 컴포넌트
-const CommentSection = ({ postId, currentUser }) => {
+const CommentSection = ({ postId, currentUser, initialComments, readOnly = false }) => {
   const [comments, setComments] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
+  const eventSourceRef = useRef(null);
 
   useEffect(() => {
+    // 상세 화면 요청에 포함된 첫 페이지가 있으면 그대로 사용하고 나머지만 이어서 조회
+    if (initialComments) {
+      setComments(initialComments.items);
+      setLoading(false);
+      if (initialComments.next_after) {
+        loadRemainingComments(initialComments.next_after);
+      }
+      return;
+    }
     loadComments();
   }, [postId]);
 
+  // 댓글 변경사항 실시간 구독
+  useEffect(() => {
+    const source = eventsAPI.subscribePost(postId);
+    eventSourceRef.current = source;
+
+    source.addEventListener('comment_created', (e) => {
+      const comment = JSON.parse(e.data);
+      setComments(prev => insertByPath(prev, comment));
+    });
+
+    source.addEventListener('comment_deleted', (e) => {
+      const { id, ids } = JSON.parse(e.data);
+      const removed = new Set(ids || [id]); // 하위 답글 포함
+      setComments(prev => prev.filter(c => !removed.has(c.id)));
+    });
+
+    // 재접속 시 서버가 놓친 이벤트를 다시 보낼 수 없으면 목록 전체를 다시 조회
+    source.addEventListener('resync', () => {
+      loadComments();
+    });
+
+    return () => {
+      source.close();
+      eventSourceRef.current = null;
+    };
+  }, [postId]);
+
+  // 실시간 연결이 없을 때만 목록 새로고침
+  const isLive = () => eventSourceRef.current?.readyState === EventSource.OPEN;
+
   const loadComments = async () => {
     setLoading(true);
     setError(null);
@@ -138,10 +193,23 @@ const CommentSection = ({ postId, currentUser }) => {
     }
   };
 
+  const loadRemainingComments = async (after) => {
+    try {
+      const rest = await commentAPI.getComments(postId, after);
+      setComments(prev => {
+        const seen = new Set(prev.map(c => c.id));
+        // 실시간으로 먼저 들어온 댓글이 있을 수 있으므로 path 순으로 다시 정렬
+        return [...prev, ...rest.filter(c => !seen.has(c.id))].sort((a, b) => (a.path < b.path ? -1 : a.path > b.path ? 1 : 0));
+      });
+    } catch (error) {
+      console.error('댓글 로드 실패:', error);
+    }
+  };
+
   const handleCommentSubmit = async (commentData) => {
     try {
       await commentAPI.createComment(postId, commentData);
-      await loadComments(); // 댓글 목록 새로고침
+      if (!isLive()) await loadComments(); // 댓글 목록 새로고침
     } catch (error) {
       throw error;
     }
@@ -150,7 +218,7 @@ const CommentSection = ({ postId, currentUser }) => {
   const handleDeleteComment = async (commentId) => {
     try {
       await commentAPI.deleteComment(commentId);
-      await loadComments(); // 댓글 목록 새로고침
+      if (!isLive()) await loadComments(); // 댓글 목록 새로고침
     } catch (error) {
       throw error;
     }
@@ -201,17 +269,19 @@ const CommentSection = ({ postId, currentUser }) => {
                 key={comment.id}
                 comment={comment}
                 onDelete={handleDeleteComment}
-                currentUser={currentUser}
+                currentUser={readOnly ? null : currentUser}
               />
             ))}
           </div>
         )}
 
-        {/* 댓글 작성 폼 */}
-        <CommentForm 
-          onSubmit={handleCommentSubmit} 
-          currentUser={currentUser}
-        />
+        {/* 댓글 작성 폼 (보관된 게시글은 제외) */}
+        {!readOnly && (
+          <CommentForm 
+            onSubmit={handleCommentSubmit} 
+            currentUser={currentUser}
+          />
+        )}
       </div>
     </div>
   );
@@ -8,6 +8,8 @@ import DOMPurify from 'dompurify';
 
 const PostDetail = ({ postId, onBack, currentUser, onEdit }) => {
   const [post, setPost] = useState(null);
+  const [initialComments, setInitialComments] = useState(null);
+  const [viewer, setViewer] = useState(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [isDeleting, setIsDeleting] = useState(false);
@@ -21,8 +23,11 @@ const PostDetail = ({ postId, onBack, currentUser, onEdit }) => {
     setError(null);
     
     try {
-      const response = await postAPI.getPost(postId);
-      setPost(response);
+      // 게시글, 댓글 첫 페이지, 권한을 한 번의 요청으로 조회
+      const bundle = await postAPI.getPostBundle(postId);
+      setPost(bundle.post);
+      setInitialComments(bundle.comments);
+      setViewer(bundle.viewer);
     } catch (error) {
       console.error('게시글 로드 실패:', error);
       setError('게시글을 불러올 수 없습니다.');
@@ -138,15 +143,17 @@ const PostDetail = ({ postId, onBack, currentUser, onEdit }) => {
             </h1>
             
             {/* 작성자 액션 버튼 */}
-            {post.author_id === currentUser && (
+            {(viewer ? viewer.can_delete : post.author_id === currentUser) && (
               <div className="flex space-x-2">
-                <button
-                  onClick={handleEditPost}
-                  className="text-gray-500 hover:text-blue-600 transition-colors p-2 rounded-lg hover:bg-gray-100"
-                  title="수정"
-                >
-                  <Edit className="w-5 h-5" />
-                </button>
+                {(viewer ? viewer.can_edit : !post.archived) && (
+                  <button
+                    onClick={handleEditPost}
+                    className="text-gray-500 hover:text-blue-600 transition-colors p-2 rounded-lg hover:bg-gray-100"
+                    title="수정"
+                  >
+                    <Edit className="w-5 h-5" />
+                  </button>
+                )}
                 <button
                   onClick={handleDeletePost}
                   disabled={isDeleting}
@@ -179,6 +186,12 @@ const PostDetail = ({ postId, onBack, currentUser, onEdit }) => {
                 <span>조회 {post.view_count}</span>
               </div>
             )}
+            
+            {post.archived && (
+              <span className="px-2 py-0.5 rounded bg-gray-100 text-gray-500 text-xs">
+                보관된 게시글 (읽기 전용)
+              </span>
+            )}
           </div>
         </div>
 
@@ -204,6 +217,8 @@ const PostDetail = ({ postId, onBack, currentUser, onEdit }) => {
       <CommentSection 
         postId={postId} 
         currentUser={currentUser}
+        initialComments={initialComments}
+        readOnly={post.archived}
       />
     </div>
   );
@@ -1,12 +1,32 @@
 // components/post/PostList.jsx
-import React, { useState } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { Search, Trash2, MessageCircle, Eye, ThumbsUp, ThumbsDown } from 'lucide-react';
 import { formatRelativeTime } from '../../utils/dateUtils';
+import { postAPI } from '../../services/api';
 
 // 검색바 컴포넌트
-const SearchBar = ({ searchQuery, setSearchQuery, onSearch, onClear }) => {
+const SearchBar = ({ searchQuery, setSearchQuery, onSearch, onClear, onSelectPost }) => {
+  const [suggestions, setSuggestions] = useState([]);
+  const latestQuery = useRef('');
+
+  // 입력할 때마다 제목 자동완성 조회 (늦게 도착한 이전 응답은 무시)
+  useEffect(() => {
+    const prefix = searchQuery.trim();
+    latestQuery.current = prefix;
+    if (!prefix) {
+      setSuggestions([]);
+      return;
+    }
+    postAPI.suggestPosts(prefix)
+      .then(response => {
+        if (latestQuery.current === prefix) setSuggestions(response.suggestions);
+      })
+      .catch(() => setSuggestions([]));
+  }, [searchQuery]);
+
   const handleKeyPress = (e) => {
     if (e.key === 'Enter') {
+      setSuggestions([]);
       onSearch();
     }
   };
@@ -22,8 +42,22 @@ const SearchBar = ({ searchQuery, setSearchQuery, onSearch, onClear }) => {
             value={searchQuery}
             onChange={(e) => setSearchQuery(e.target.value)}
             onKeyPress={handleKeyPress}
+            onBlur={() => setTimeout(() => setSuggestions([]), 150)}
             className="w-full pl-10 pr-3 py-2 border border-gray-300 rounded-md focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-transparent"
           />
+          {suggestions.length > 0 && onSelectPost && (
+            <ul className="absolute z-10 left-0 right-0 mt-1 bg-white border border-gray-300 rounded-md shadow-lg">
+              {suggestions.map(item => (
+                <li
+                  key={item.id}
+                  onMouseDown={() => onSelectPost(item.id)}
+                  className="px-3 py-2 text-sm text-gray-800 hover:bg-gray-100 cursor-pointer truncate"
+                >
+                  {item.title}
+                </li>
+              ))}
+            </ul>
+          )}
         </div>
         <div className="flex space-x-2">
           <button
@@ -266,6 +300,7 @@ const PostList = ({
           setSearchQuery={setSearchQuery}
           onSearch={onSearch}
           onClear={onClearSearch}
+          onSelectPost={onSelectPost}
         />
         <LoadingState />
       </div>
@@ -280,6 +315,7 @@ const PostList = ({
         setSearchQuery={setSearchQuery}
         onSearch={onSearch}
         onClear={onClearSearch}
+        onSelectPost={onSelectPost}
       />
 
       {/* 게시글 목록 */}
@@ -62,6 +62,11 @@ export const postAPI = {
   getPost: async (id) => {
     return fetchAPI(`/posts/${id}`);
   },
+
+  // 게시글 상세 화면 데이터 (게시글 + 댓글 첫 페이지 + 사용자 권한)
+  getPostBundle: async (id) => {
+    return fetchAPI(`/posts/${id}/bundle`);
+  },
   
   createPost: async (data) => {
     return fetchAPI('/posts', {
@@ -79,12 +84,18 @@ export const postAPI = {
   searchPosts: async (query) => {
     return fetchAPI(`/posts/search?q=${encodeURIComponent(query)}`);
   },
+
+  // 제목 자동완성 (입력할 때마다 호출)
+  suggestPosts: async (prefix, limit = 8) => {
+    return fetchAPI(`/posts/suggest?prefix=${encodeURIComponent(prefix)}&limit=${limit}`);
+  },
 };
 
 // 댓글 API
 export const commentAPI = {
-  getComments: async (postId) => {
-    return fetchAPI(`/comments/post/${postId}`);
+  getComments: async (postId, after = null) => {
+    const query = after ? `?after=${encodeURIComponent(after)}` : '';
+    return fetchAPI(`/comments/post/${postId}${query}`);
   },
 
   createComment: async (postId, data) => {
@@ -101,6 +112,17 @@ export const commentAPI = {
   },
 };
 
+// 실시간 이벤트 API (Server-Sent Events)
+export const eventsAPI = {
+  subscribePost: (postId) => {
+    return new EventSource(`${API_BASE}/events/posts/${postId}`, { withCredentials: true });
+  },
+
+  subscribeBoard: () => {
+    return new EventSource(`${API_BASE}/events/board`, { withCredentials: true });
+  },
+};
+
 // 파일 업로드 API
 export const uploadAPI = {
   uploadFile: async (file) => {
@@ -122,4 +144,57 @@ export const uploadAPI = {
       body: formData,
     });
   },
+
+  // 이어받기 업로드 (청크 단위 전송, 연결이 끊기면 서버 오프셋부터 재개)
+  uploadResumable: async (file, onProgress = null, maxRetries = 5) => {
+    const session = await fetchAPI('/upload/sessions', {
+      method: 'POST',
+      body: JSON.stringify({ filename: file.name, size: file.size, mime_type: file.type || null }),
+    });
+    const url = `${API_BASE}/upload/sessions/${session.upload_id}`;
+    let offset = 0;
+    let retries = 0;
+
+    while (true) {
+      const chunk = await file.slice(offset, offset + session.chunk_size).arrayBuffer();
+      const digest = await crypto.subtle.digest('SHA-256', chunk);
+      const checksum = btoa(String.fromCharCode(...new Uint8Array(digest)));
+
+      try {
+        const response = await fetch(url, {
+          method: 'PATCH',
+          credentials: 'include',
+          headers: {
+            'Content-Type': 'application/offset+octet-stream',
+            'Upload-Offset': String(offset),
+            'Upload-Checksum': `sha256 ${checksum}`,
+          },
+          body: chunk,
+        });
+        if (!response.ok) {
+          // 오프셋 불일치(409), 체크섬 오류(460)도 재시도 횟수에 포함 (계속 실패하면 중단)
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        const result = await response.json();
+        retries = 0;
+        offset = result.offset;
+        if (onProgress) onProgress(offset / file.size);
+        if (result.completed) return result.file;
+        continue;
+      } catch (error) {
+        if (++retries > maxRetries) throw error;
+        await new Promise(resolve => setTimeout(resolve, 1000 * retries));
+      }
+
+      // 서버가 받은 위치부터 재개
+      const head = await fetch(url, { method: 'HEAD', credentials: 'include' });
+      if (!head.ok) throw new Error(`HTTP error! status: ${head.status}`);
+      offset = Number(head.headers.get('Upload-Offset'));
+      if (offset >= file.size) {
+        // 마지막 청크 응답을 받지 못했지만 서버에서는 이미 완료됨
+        const status = await fetchAPI(`/upload/sessions/${session.upload_id}`);
+        if (status.completed) return status.file;
+      }
+    }
+  },
 };
\ No newline at end of file
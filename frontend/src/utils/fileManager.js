@@ -7,6 +7,10 @@
  * - 취소하면 임시 파일 정리
  */
 
+// 이 크기를 넘는 파일은 이어받기 업로드 사용
+export const RESUMABLE_THRESHOLD = 10 * 1024 * 1024; // 10MB
+export const MAX_RESUMABLE_FILE_SIZE = 2 * 1024 * 1024 * 1024; // 2GB
+
 class FileManager {
   constructor() {
     this.tempFiles = new Map(); // 임시 파일들 저장
@@ -57,7 +61,11 @@ class FileManager {
     const urlMapping = new Map(); // tempUrl -> realUrl 매핑
     
     for (const [tempId, file] of this.tempFiles) {
-      const uploadPromise = uploadAPI.uploadFile(file)
+      // 큰 파일은 청크 단위 이어받기 업로드
+      const upload = file.size > RESUMABLE_THRESHOLD
+        ? uploadAPI.uploadResumable(file)
+        : uploadAPI.uploadFile(file);
+      const uploadPromise = upload
         .then(result => {
           const tempUrl = this.tempUrls.get(tempId);
           urlMapping.set(tempUrl, result.url);